@@ -3,15 +3,18 @@ Configuration management for VisionCursor.
 
 All application configuration with sensible defaults.
 Uses dataclasses for type safety and validation.
+Configs are frozen; derive modified copies with dataclasses.replace().
 """
 
 from dataclasses import dataclass, field
-from typing import Tuple
+from typing import Optional, Tuple
+import functools
 import os
+import stat
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CameraConfig:
     """Camera capture configuration."""
 
@@ -21,8 +24,12 @@ class CameraConfig:
     target_fps: int = 30  # Smooth but not excessive CPU usage
     warmup_frames: int = 10  # Frames to skip after camera init
 
+    # Capture in a separate process writing to a shared-memory ring buffer
+    # (isolates capture from GIL contention and UI pauses)
+    use_capture_process: bool = False
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GazeConfig:
     """Gaze estimation configuration."""
 
@@ -44,8 +51,26 @@ class GazeConfig:
     # Freeze cursor when face lost (instead of drifting)
     freeze_on_face_lost: bool = True
 
+    # (width, height) bound to downscale frames to before face tracking,
+    # or None for full resolution (smaller is faster, at some cost in iris
+    # precision; the frame's aspect ratio is kept, e.g. (320, 240) for 640x480)
+    inference_size: Optional[Tuple[int, int]] = None
+
+    def __post_init__(self):
+        """Validate the inference size."""
+        if self.inference_size is None:
+            return
+
+        if (
+            len(self.inference_size) != 2
+            or not all(isinstance(v, int) and v > 0 for v in self.inference_size)
+        ):
+            raise ValueError(
+                f"inference_size must be two positive integers: {self.inference_size}"
+            )
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CalibrationConfig:
     """Calibration procedure configuration."""
 
@@ -75,7 +100,7 @@ class CalibrationConfig:
     min_stable_samples: int = 60  # Require at least this many stable samples
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StorageConfig:
     """Data storage configuration."""
 
@@ -91,29 +116,53 @@ class StorageConfig:
     # Enable file logging (OFF by default for privacy)
     enable_file_logging: bool = False
 
+    # Write calibration via temp file + rename, so a crash mid-write cannot
+    # leave a truncated file. Disable to write the file in place.
+    atomic_write: bool = True
+
+    # Derived paths (built once in __post_init__)
+    _calibration_path: Path = field(init=False, repr=False, compare=False)
+    _log_path: Path = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Ensure data directory exists and is secure."""
-        self.data_dir = Path(self.data_dir)
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        data_dir = Path(self.data_dir)
+
+        # Reject relative traversal components outright
+        if ".." in data_dir.parts:
+            raise ValueError(f"Invalid data directory path: {data_dir}")
+
+        data_dir.mkdir(parents=True, exist_ok=True)
 
-        # Validate path to prevent directory traversal
+        # Check the unresolved path: resolve() would follow a symlink
+        # before it could be detected
         try:
-            self.data_dir.resolve(strict=True)
-        except (RuntimeError, OSError) as e:
+            st = os.lstat(data_dir)
+        except OSError as e:
             raise ValueError(f"Invalid data directory path: {e}")
 
+        if stat.S_ISLNK(st.st_mode):
+            raise ValueError(f"Data directory must not be a symlink: {data_dir}")
+
+        # Canonicalize once; derived paths reuse it without re-resolving
+        object.__setattr__(self, "data_dir", Path(os.path.realpath(data_dir)))
+        object.__setattr__(
+            self, "_calibration_path", self.data_dir / self.calibration_filename
+        )
+        object.__setattr__(self, "_log_path", self.data_dir / self.log_filename)
+
     @property
     def calibration_path(self) -> Path:
         """Get full path to calibration data file."""
-        return self.data_dir / self.calibration_filename
+        return self._calibration_path
 
     @property
     def log_path(self) -> Path:
         """Get full path to log file."""
-        return self.data_dir / self.log_filename
+        return self._log_path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UIConfig:
     """User interface configuration."""
 
@@ -139,7 +188,7 @@ class UIConfig:
     toggle_shortcut: str = "Space"  # Keyboard shortcut to toggle tracking
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """Main application configuration."""
 
@@ -182,10 +231,13 @@ class AppConfig:
             raise ValueError("target_fps must be between 1 and 60")
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_config() -> AppConfig:
     """
     Get default application configuration.
 
+    The instance is built once and shared (configs are frozen).
+
     Returns:
         AppConfig instance with default values
     """
@@ -4,29 +4,40 @@ Central controller orchestrating the gaze tracking pipeline.
 Manages state transitions and coordinates all components.
 """
 
-from typing import Optional, Callable
-from dataclasses import dataclass
+from typing import Optional, Callable, TYPE_CHECKING
+from dataclasses import dataclass, replace
+import threading
 import time
 
 from src.core.config import AppConfig
-from src.core.state import StateMachine, AppState, ErrorInfo
-from src.vision.camera import Camera, CameraFrame, CameraError
-from src.vision.face_tracker import FaceTracker, FaceLandmarks
+from src.core.state import StateMachine, AppState, ErrorInfo, ACTIVE_STATES
 from src.vision.gaze_estimator import GazeEstimator, GazeVector
 from src.vision.calibrator import Calibrator, CalibrationState, GazeMapper
 from src.vision.smoothing import GazeSmoother, SmoothedGaze
-from src.os_control.cursor_controller import CursorController
 from src.storage.calibration_store import CalibrationStore, CalibrationStoreError
 from src.storage.schema import CalibrationData
 from src.utils.timing import FPSCounter
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    # Heavy dependencies (OpenCV, MediaPipe, pynput) are imported lazily
+    # in Controller.initialize() to keep cold start fast
+    from src.vision.camera import Camera, CameraFrame
+    from src.vision.capture_process import CaptureProcess
+    from src.vision.face_tracker import FaceTracker, FaceLandmarks
+    from src.os_control.cursor_controller import CursorController
+
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FrameProcessingResult:
-    """Result of processing a single frame."""
+    """
+    Result of processing a single frame.
+
+    Stays in the worker thread: the UI receives only primitive stats
+    (ProcessingWorker.frame_stats), so no Qt metatype is involved.
+    """
 
     success: bool
     face_detected: bool
@@ -35,6 +46,10 @@ class FrameProcessingResult:
     fps: float = 0.0
 
 
+# Shared result for dropped camera frames (immutable, so safe to reuse)
+NO_FRAME = FrameProcessingResult(success=False, face_detected=False)
+
+
 class Controller:
     """
     Central controller for VisionCursor.
@@ -63,30 +78,46 @@ class Controller:
         self._screen_width = screen_width
         self._screen_height = screen_height
 
+        # Hot-path config values (read every frame)
+        self._freeze_on_face_lost = config.gaze.freeze_on_face_lost
+        self._countdown_seconds = config.calibration.countdown_seconds
+
         # State machine
         self._state_machine = StateMachine(initial_state=AppState.IDLE)
 
         # Components (initialized lazily)
-        self._camera: Optional[Camera] = None
-        self._face_tracker: Optional[FaceTracker] = None
+        self._camera: Optional["Camera | CaptureProcess"] = None
+        self._face_tracker: Optional["FaceTracker"] = None
         self._gaze_estimator: Optional[GazeEstimator] = None
         self._calibrator: Optional[Calibrator] = None
         self._gaze_mapper: Optional[GazeMapper] = None
         self._smoother: Optional[GazeSmoother] = None
-        self._cursor_controller: Optional[CursorController] = None
+        self._cursor_controller: Optional["CursorController"] = None
         self._calibration_store: Optional[CalibrationStore] = None
 
         # Performance monitoring
         self._fps_counter = FPSCounter()
 
-        # Calibration countdown tracking
-        self._calibration_countdown_start: Optional[float] = None
+        # Calibration countdown tracking (monotonic deadline)
+        self._calibration_countdown_deadline: Optional[float] = None
 
         # Tracking control (for safety)
+        # Writes are serialized by the lock; reads (per frame) are a plain
+        # bool load, which is atomic under the GIL
         self._tracking_enabled = False  # User must explicitly enable
+        self._tracking_lock = threading.Lock()
 
         # Last valid cursor position (for freeze on face lost)
-        self._last_cursor_pos: Optional[tuple[int, int]] = None
+        # (-1 = no position yet; plain ints avoid a tuple per frame)
+        self._last_cursor_x = -1
+        self._last_cursor_y = -1
+
+        # Cached result of the calibration file existence check
+        self._calibration_exists_cache: Optional[bool] = None
+
+        # Last position actually sent to the OS (skip redundant moves)
+        self._last_moved_x = -1
+        self._last_moved_y = -1
 
         logger.info(f"Controller initialized for {screen_width}x{screen_height}")
 
@@ -101,13 +132,33 @@ class Controller:
             Exception: If initialization fails
         """
         try:
+            from src.vision.camera import Camera
+            from src.vision.face_tracker import FaceTracker
+            from src.os_control.cursor_controller import CursorController
+
             # Camera
-            self._camera = Camera(self._config.camera)
+            if self._config.camera.use_capture_process:
+                from src.vision.capture_process import CaptureProcess
+
+                self._camera = CaptureProcess(self._config.camera)
+            else:
+                # Shrinks before BGR->RGB, so the tracker's own downscale
+                # becomes a no-op and conversion touches fewer pixels
+                self._camera = Camera(
+                    self._config.camera,
+                    output_size=self._config.gaze.inference_size,
+                )
 
             # Face tracker
             self._face_tracker = FaceTracker(
                 min_detection_confidence=self._config.gaze.min_face_confidence,
                 min_tracking_confidence=self._config.gaze.min_face_confidence,
+                include_all_landmarks=self._config.ui.show_debug_overlay,
+                inference_size=self._config.gaze.inference_size,
+            )
+            self._face_tracker.start_warmup(
+                self._config.camera.frame_width,
+                self._config.camera.frame_height,
             )
 
             # Gaze estimator
@@ -163,7 +214,7 @@ class Controller:
         - Camera available
         """
         if not self._state_machine.can_transition_to(AppState.TRACKING):
-            logger.warning(f"Cannot start tracking from state {self._state_machine.current_state}")
+            logger.warning(f"Cannot start tracking from state {self._state_machine.current_state.name}")
             return False
 
         # Check if calibration exists
@@ -179,6 +230,8 @@ class Controller:
                 )
                 return False
 
+        from src.vision.camera import CameraError
+
         # Open camera
         try:
             if not self._camera.is_open:
@@ -187,7 +240,10 @@ class Controller:
             self._cursor_controller.enable()
             self._smoother.reset()
             self._fps_counter.reset()
-            self._tracking_enabled = True  # Enable tracking by default
+            self._last_moved_x = -1
+            self._last_moved_y = -1
+            with self._tracking_lock:
+                self._tracking_enabled = True  # Enable tracking by default
 
             self._state_machine.transition_to(AppState.TRACKING)
             logger.info("Tracking started")
@@ -211,7 +267,8 @@ class Controller:
             True if stopped successfully
         """
         if self._state_machine.current_state == AppState.TRACKING:
-            self._tracking_enabled = False  # Disable tracking
+            with self._tracking_lock:
+                self._tracking_enabled = False  # Disable tracking
             self._cursor_controller.disable()
             self._camera.close()
             self._state_machine.transition_to(AppState.IDLE)
@@ -235,6 +292,8 @@ class Controller:
         if self._state_machine.current_state == AppState.PAUSED:
             self._cursor_controller.enable()
             self._smoother.reset()
+            self._last_moved_x = -1
+            self._last_moved_y = -1
             self._state_machine.transition_to(AppState.TRACKING)
             logger.info("Tracking resumed")
             return True
@@ -249,9 +308,11 @@ class Controller:
             True if started successfully
         """
         if not self._state_machine.can_transition_to(AppState.CALIBRATING):
-            logger.warning(f"Cannot start calibration from state {self._state_machine.current_state}")
+            logger.warning(f"Cannot start calibration from state {self._state_machine.current_state.name}")
             return False
 
+        from src.vision.camera import CameraError
+
         try:
             # Open camera if not already open
             if not self._camera.is_open:
@@ -260,7 +321,7 @@ class Controller:
             # Start calibrator
             self._calibrator.start()
             self._calibrator.set_state(CalibrationState.COUNTDOWN)
-            self._calibration_countdown_start = time.time()
+            self._start_countdown()
 
             self._state_machine.transition_to(AppState.CALIBRATING)
             logger.info("Calibration started")
@@ -284,50 +345,69 @@ class Controller:
             FrameProcessingResult with processing details
 
         Call this from the main loop / worker thread.
+        Does no camera or face-tracking work unless tracking or calibrating.
         """
-        result = FrameProcessingResult(
-            success=False,
-            face_detected=False,
-            fps=self._fps_counter.tick(),
-        )
-
         current_state = self._state_machine.current_state
 
-        # Read camera frame
-        frame = self._camera.read_frame()
+        # Skip the capture and detection pass entirely when not active
+        if current_state not in ACTIVE_STATES:
+            return FrameProcessingResult(
+                success=False,
+                face_detected=False,
+                fps=self._fps_counter.fps,
+            )
+
+        # Read the newest camera frame (stale buffered frames are dropped
+        # so a slow frame does not leave the pipeline lagging behind)
+        frame = self._camera.read_latest()
         if frame is None:
-            return result
+            return NO_FRAME
+
+        fps = self._fps_counter.tick()
 
         # Detect face
         face_landmarks = self._face_tracker.process_frame(frame.image)
         if face_landmarks is None:
             # Face not detected - freeze cursor if configured
-            if current_state == AppState.TRACKING and self._config.gaze.freeze_on_face_lost:
-                result.cursor_pos = self._last_cursor_pos
-            return result
-
-        result.face_detected = True
+            return FrameProcessingResult(
+                success=False,
+                face_detected=False,
+                cursor_pos=self._frozen_cursor_position(current_state),
+                fps=fps,
+            )
 
         # Estimate gaze
         gaze = self._gaze_estimator.estimate(face_landmarks)
         if gaze is None:
             # Gaze estimation failed - freeze cursor if configured
-            if current_state == AppState.TRACKING and self._config.gaze.freeze_on_face_lost:
-                result.cursor_pos = self._last_cursor_pos
-            return result
-
-        result.gaze = gaze
+            return FrameProcessingResult(
+                success=False,
+                face_detected=True,
+                cursor_pos=self._frozen_cursor_position(current_state),
+                fps=fps,
+            )
 
         # State-specific processing
+        cursor_pos = None
         if current_state == AppState.CALIBRATING:
             self._process_calibration_frame(gaze)
 
         elif current_state == AppState.TRACKING:
             cursor_pos = self._process_tracking_frame(gaze)
-            result.cursor_pos = cursor_pos
 
-        result.success = True
-        return result
+        return FrameProcessingResult(
+            success=True,
+            face_detected=True,
+            gaze=gaze,
+            cursor_pos=cursor_pos,
+            fps=fps,
+        )
+
+    def _frozen_cursor_position(self, current_state: AppState) -> Optional[tuple[int, int]]:
+        """Get cursor position to report when no gaze is available."""
+        if current_state == AppState.TRACKING and self._freeze_on_face_lost:
+            return self._last_cursor_position()
+        return None
 
     def _process_calibration_frame(self, gaze: GazeVector):
         """Process frame during calibration."""
@@ -335,9 +415,7 @@ class Controller:
 
         # Handle countdown
         if cal_state == CalibrationState.COUNTDOWN:
-            elapsed = time.time() - self._calibration_countdown_start
-
-            if elapsed >= self._config.calibration.countdown_seconds:
+            if time.monotonic() >= self._calibration_countdown_deadline:
                 # Start collecting samples
                 self._calibrator.set_state(CalibrationState.COLLECTING)
                 logger.debug("Calibration sample collection started")
@@ -347,14 +425,21 @@ class Controller:
             self._calibrator.add_sample(gaze)
 
             # Check if target completed (handled internally by calibrator)
-            if self._calibrator.state == CalibrationState.COUNTDOWN:
+            cal_state = self._calibrator.state
+            if cal_state == CalibrationState.COUNTDOWN:
                 # Target completed, moved to next target
-                self._calibration_countdown_start = time.time()
+                self._start_countdown()
 
-            elif self._calibrator.state == CalibrationState.COMPLETED:
+            elif cal_state == CalibrationState.COMPLETED:
                 # All targets completed, save calibration
                 self._finalize_calibration()
 
+    def _start_countdown(self):
+        """Arm the countdown deadline for the current calibration target."""
+        self._calibration_countdown_deadline = (
+            time.monotonic() + self._countdown_seconds
+        )
+
     def _process_tracking_frame(self, gaze: GazeVector) -> Optional[tuple[int, int]]:
         """Process frame during tracking."""
         if self._gaze_mapper is None:
@@ -362,21 +447,34 @@ class Controller:
 
         # Check if tracking is enabled (safety control)
         if not self._tracking_enabled:
-            return self._last_cursor_pos
+            return self._last_cursor_position()
 
         # Map gaze to screen coordinates
         screen_x, screen_y = self._gaze_mapper.map_gaze_to_screen(gaze)
 
         # Apply smoothing
         smoothed = self._smoother.smooth(screen_x, screen_y)
+        x = smoothed.x
+        y = smoothed.y
 
-        # Move cursor
-        self._cursor_controller.move_to(smoothed.x, smoothed.y)
+        # Move cursor only when it lands on a different pixel
+        # (sub-pixel jitter would otherwise issue a syscall every frame)
+        if x != self._last_moved_x or y != self._last_moved_y:
+            if self._cursor_controller.move_to(x, y):
+                self._last_moved_x = x
+                self._last_moved_y = y
 
         # Remember last position
-        self._last_cursor_pos = (smoothed.x, smoothed.y)
+        self._last_cursor_x = x
+        self._last_cursor_y = y
+
+        return (x, y)
 
-        return (smoothed.x, smoothed.y)
+    def _last_cursor_position(self) -> Optional[tuple[int, int]]:
+        """Get last valid cursor position, or None if there is none yet."""
+        if self._last_cursor_x < 0:
+            return None
+        return (self._last_cursor_x, self._last_cursor_y)
 
     def _finalize_calibration(self):
         """Finalize and save calibration."""
@@ -395,6 +493,7 @@ class Controller:
         try:
             # Save to disk
             self._calibration_store.save(calibration_data)
+            self._calibration_exists_cache = None
 
             # Create mapper
             self._gaze_mapper = GazeMapper(calibration_data)
@@ -448,6 +547,7 @@ class Controller:
         try:
             self._calibration_store.delete()
             self._gaze_mapper = None
+            self._calibration_exists_cache = None
             logger.info("Calibration deleted")
             return True
 
@@ -457,18 +557,23 @@ class Controller:
 
     def update_sensitivity(self, sensitivity: float):
         """Update cursor sensitivity."""
-        self._config.gaze.sensitivity = sensitivity
+        self._config = replace(
+            self._config,
+            gaze=replace(self._config.gaze, sensitivity=sensitivity),
+        )
         self._smoother.update_config(self._config.gaze)
         logger.debug(f"Sensitivity updated: {sensitivity:.2f}")
 
     def enable_tracking(self):
         """Enable cursor tracking (safety control)."""
-        self._tracking_enabled = True
+        with self._tracking_lock:
+            self._tracking_enabled = True
         logger.info("Cursor tracking enabled")
 
     def disable_tracking(self):
         """Disable cursor tracking (safety control)."""
-        self._tracking_enabled = False
+        with self._tracking_lock:
+            self._tracking_enabled = False
         logger.info("Cursor tracking disabled")
 
     def toggle_tracking(self) -> bool:
@@ -478,10 +583,24 @@ class Controller:
         Returns:
             New tracking state (True = enabled)
         """
-        self._tracking_enabled = not self._tracking_enabled
-        state_str = "enabled" if self._tracking_enabled else "disabled"
+        with self._tracking_lock:
+            enabled = not self._tracking_enabled
+            self._tracking_enabled = enabled
+
+        state_str = "enabled" if enabled else "disabled"
         logger.info(f"Cursor tracking toggled: {state_str}")
-        return self._tracking_enabled
+        return enabled
+
+    def set_state_listener(self, listener: Optional[Callable[[AppState], None]]):
+        """
+        Register a callback invoked with the new state on each state change.
+
+        Called on the thread that made the change (UI or worker).
+
+        Args:
+            listener: Callable taking the new AppState, or None to clear
+        """
+        self._state_machine.set_listener(listener)
 
     def is_tracking_enabled(self) -> bool:
         """Check if tracking is currently enabled."""
@@ -520,8 +639,14 @@ class Controller:
 
     @property
     def has_calibration(self) -> bool:
-        """Check if calibration exists."""
-        return self._gaze_mapper is not None or self._calibration_store.exists()
+        """Check if calibration exists (file check is cached)."""
+        if self._gaze_mapper is not None:
+            return True
+
+        if self._calibration_exists_cache is None:
+            self._calibration_exists_cache = self._calibration_store.exists()
+
+        return self._calibration_exists_cache
 
     @property
     def fps(self) -> float:
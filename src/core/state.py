@@ -4,12 +4,13 @@ Application state management.
 Defines the state machine for VisionCursor with clear transitions.
 """
 
-from enum import Enum, auto
-from typing import Optional, Set
+from enum import IntEnum, auto
+import threading
+from typing import Callable, Optional, FrozenSet, NamedTuple
 from dataclasses import dataclass
 
 
-class AppState(Enum):
+class AppState(IntEnum):
     """
     Application states.
 
@@ -18,6 +19,8 @@ class AppState(Enum):
         IDLE -> TRACKING -> PAUSED -> TRACKING
         TRACKING -> IDLE
         Any -> ERROR -> IDLE
+
+    IntEnum so members index the transition table directly.
     """
 
     IDLE = auto()           # Camera off, no tracking
@@ -27,48 +30,122 @@ class AppState(Enum):
     ERROR = auto()          # Error state, requires user intervention
 
 
-@dataclass
-class StateTransition:
-    """Represents a state transition with validation."""
+# States in which frames are captured and processed (checked per frame;
+# AppState is an IntEnum, so membership is a plain int hash/compare)
+ACTIVE_STATES: FrozenSet[AppState] = frozenset({
+    AppState.TRACKING,
+    AppState.CALIBRATING,
+})
+
+
+class StateTransition(NamedTuple):
+    """
+    Represents a state transition.
+
+    Plain construction does not validate; use validated() when an
+    exception on an invalid transition is wanted.
+    """
 
     from_state: AppState
     to_state: AppState
 
-    def __post_init__(self):
-        """Validate transition is allowed."""
-        if not is_valid_transition(self.from_state, self.to_state):
+    @classmethod
+    def validated(cls, from_state: AppState, to_state: AppState) -> "StateTransition":
+        """
+        Create a transition, checking it is allowed.
+
+        Args:
+            from_state: Current state
+            to_state: Target state
+
+        Returns:
+            StateTransition instance
+
+        Raises:
+            ValueError: If the transition is not allowed
+        """
+        if not is_valid_transition(from_state, to_state):
             raise ValueError(
-                f"Invalid state transition: {self.from_state.name} -> {self.to_state.name}"
+                f"Invalid state transition: {from_state.name} -> {to_state.name}"
             )
+        return cls(from_state, to_state)
 
 
 # Define valid state transitions
-_VALID_TRANSITIONS: dict[AppState, Set[AppState]] = {
-    AppState.IDLE: {
+_VALID_TRANSITIONS: dict[AppState, FrozenSet[AppState]] = {
+    AppState.IDLE: frozenset({
         AppState.CALIBRATING,
         AppState.TRACKING,
         AppState.ERROR,
-    },
-    AppState.CALIBRATING: {
+    }),
+    AppState.CALIBRATING: frozenset({
         AppState.IDLE,
         AppState.ERROR,
-    },
-    AppState.TRACKING: {
+    }),
+    AppState.TRACKING: frozenset({
         AppState.PAUSED,
         AppState.IDLE,
         AppState.ERROR,
-    },
-    AppState.PAUSED: {
+    }),
+    AppState.PAUSED: frozenset({
         AppState.TRACKING,
         AppState.IDLE,
         AppState.ERROR,
-    },
-    AppState.ERROR: {
+    }),
+    AppState.ERROR: frozenset({
         AppState.IDLE,
-    },
+    }),
 }
 
 
+
+def _build_transition_mask() -> tuple[int, ...]:
+    """
+    Flatten _VALID_TRANSITIONS into a bitmask table.
+
+    Entry [from_state] has bit (1 << to_state) set for each allowed
+    target, so a check is one index and one shift. Self-transitions
+    (no-ops) are always allowed and encoded in the table, so callers
+    need no separate same-state branch.
+    """
+    mask = [0] * (max(AppState) + 1)
+    for from_state in AppState:
+        mask[from_state] |= 1 << from_state
+    for from_state, targets in _VALID_TRANSITIONS.items():
+        for to_state in targets:
+            mask[from_state] |= 1 << to_state
+    return tuple(mask)
+
+
+_TRANSITION_MASK: tuple[int, ...] = _build_transition_mask()
+
+# Per previous state, bit (1 << new_state) set where a transition clears the
+# stored error: only leaving ERROR for another state does
+_CLEAR_ERROR_MASK: tuple[int, ...] = tuple(
+    sum(1 << target for target in AppState if target is not AppState.ERROR)
+    if state == AppState.ERROR else 0
+    for state in range(max(AppState) + 1)
+)
+
+# Allowed targets per state, indexed by AppState (index 0 unused)
+_ALLOWED: tuple[FrozenSet[AppState], ...] = tuple(
+    _VALID_TRANSITIONS.get(state, frozenset()) for state in range(max(AppState) + 1)
+)
+
+
+def allowed_from(state: AppState) -> FrozenSet[AppState]:
+    """
+    Get the states reachable from a state in one transition.
+
+    Args:
+        state: Source state
+
+    Returns:
+        Frozen set of allowed target states (excluding the no-op self-transition)
+    """
+    return _ALLOWED[state]
+
+
 def is_valid_transition(from_state: AppState, to_state: AppState) -> bool:
     """
     Check if a state transition is valid.
@@ -80,14 +157,10 @@ def is_valid_transition(from_state: AppState, to_state: AppState) -> bool:
     Returns:
         True if transition is allowed, False otherwise
     """
-    # Same state is always valid (no-op)
-    if from_state == to_state:
-        return True
-
-    return to_state in _VALID_TRANSITIONS.get(from_state, set())
+    return bool((_TRANSITION_MASK[from_state] >> to_state) & 1)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ErrorInfo:
     """Information about an error that occurred."""
 
@@ -102,8 +175,19 @@ class StateMachine:
     State machine for managing application state transitions.
 
     Thread-safe state management with validation.
+
+    Writes (transition_to, set_error, reset) are serialized by a lock so
+    the check-then-act sequence cannot interleave. Reads are single
+    attribute loads and take no lock; they are atomic under the GIL.
+
+    An optional listener is called with the new state after each state
+    change, on the thread that made the change. It runs under the lock, so
+    concurrent changes are reported in the order they were applied; it
+    must be quick and must not call back into the state machine.
     """
 
+    __slots__ = ("_current_state", "_previous_state", "_error", "_lock", "_listener")
+
     def __init__(self, initial_state: AppState = AppState.IDLE):
         """
         Initialize state machine.
@@ -114,6 +198,8 @@ class StateMachine:
         self._current_state = initial_state
         self._previous_state: Optional[AppState] = None
         self._error: Optional[ErrorInfo] = None
+        self._lock = threading.Lock()
+        self._listener: Optional[Callable[[AppState], None]] = None
 
     @property
     def current_state(self) -> AppState:
@@ -140,14 +226,25 @@ class StateMachine:
         Returns:
             True if transition succeeded, False if invalid
         """
-        if not is_valid_transition(self._current_state, new_state):
+        with self._lock:
+            previous = self._current_state
+            ok = self._transition_locked(new_state)
+
+            if ok and new_state != previous:
+                self._notify(new_state)
+        return ok
+
+    def _transition_locked(self, new_state: AppState) -> bool:
+        """Validate and apply a transition (caller holds the lock)."""
+        if not (_TRANSITION_MASK[self._current_state] >> new_state) & 1:
             return False
 
-        self._previous_state = self._current_state
+        previous = self._current_state
+        self._previous_state = previous
         self._current_state = new_state
 
         # Clear error when leaving ERROR state
-        if self._previous_state == AppState.ERROR and new_state != AppState.ERROR:
+        if (_CLEAR_ERROR_MASK[previous] >> new_state) & 1:
             self._error = None
 
         return True
@@ -162,8 +259,14 @@ class StateMachine:
         Returns:
             True if transition to ERROR succeeded
         """
-        self._error = error_info
-        return self.transition_to(AppState.ERROR)
+        with self._lock:
+            previous = self._current_state
+            self._error = error_info
+            ok = self._transition_locked(AppState.ERROR)
+
+            if ok and previous != AppState.ERROR:
+                self._notify(AppState.ERROR)
+        return ok
 
     def can_transition_to(self, new_state: AppState) -> bool:
         """
@@ -175,10 +278,32 @@ class StateMachine:
         Returns:
             True if transition would be valid
         """
-        return is_valid_transition(self._current_state, new_state)
+        return bool((_TRANSITION_MASK[self._current_state] >> new_state) & 1)
 
     def reset(self):
         """Reset to IDLE state, clearing error."""
-        self._previous_state = self._current_state
-        self._current_state = AppState.IDLE
-        self._error = None
+        with self._lock:
+            previous = self._current_state
+            self._previous_state = previous
+            self._current_state = AppState.IDLE
+            self._error = None
+
+            if previous != AppState.IDLE:
+                self._notify(AppState.IDLE)
+
+    def set_listener(self, listener: Optional[Callable[[AppState], None]]):
+        """
+        Register a callback invoked with the new state on each state change.
+
+        The callback runs while the state lock is held, so it must not
+        call back into the state machine.
+
+        Args:
+            listener: Callable taking the new AppState, or None to clear
+        """
+        self._listener = listener
+
+    def _notify(self, new_state: AppState):
+        """Invoke the change listener, if any (caller holds the lock)."""
+        if self._listener is not None:
+            self._listener(new_state)
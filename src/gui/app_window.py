@@ -27,20 +27,42 @@ from PyQt6.QtWidgets import (
     QProgressBar,
     QTextEdit,
 )
-from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer, QEvent
+from PyQt6.QtCore import (
+    QThread,
+    QThreadPool,
+    QRunnable,
+    QObject,
+    pyqtSignal,
+    Qt,
+    QTimer,
+    QEvent,
+)
 from PyQt6.QtGui import QScreen, QKeySequence, QShortcut, QFont
+import threading
 import time
+from dataclasses import replace
+from typing import Optional
 
-from src.core.controller import Controller, FrameProcessingResult
+from src.core.controller import Controller, NO_FRAME
 from src.core.config import AppConfig
-from src.core.state import AppState
+from src.core.state import AppState, ACTIVE_STATES
 from src.vision.calibrator import CalibrationState
-from src.vision.camera import list_available_cameras
 from src.gui.widgets import CameraPreviewWidget, CalibrationTargetWidget
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Back-off after a failed camera read (~one frame at 30 fps)
+_FRAME_RETRY_DELAY = 0.03
+
+# Minimum interval between frame stats sent to the UI (status labels are
+# read by humans; ~10 Hz is plenty)
+_EMIT_INTERVAL = 0.1
+
+# CPython's default GIL switch interval; a lower value makes the worker and
+# UI threads hand the GIL back and forth more often for no gain
+_DEFAULT_SWITCH_INTERVAL = 0.005
+
 
 class CalibrationDialog(QDialog):
     """
@@ -98,6 +120,44 @@ class CalibrationDialog(QDialog):
         layout.addWidget(buttons)
 
 
+class _CameraListSignals(QObject):
+    """Signals for _ListCamerasTask (QRunnable is not a QObject)."""
+
+    finished = pyqtSignal(list)
+
+
+class _ListCamerasTask(QRunnable):
+    """
+    Probe available cameras off the UI thread.
+
+    Opening each device can take hundreds of milliseconds, so this runs
+    on the global thread pool instead of blocking window construction.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _CameraListSignals()
+
+    def run(self):
+        """Enumerate cameras and emit the result."""
+        try:
+            # Imported here so OpenCV loads on the pool thread, not before
+            # the first UI frame
+            from src.vision.camera import list_available_cameras
+
+            cameras = list_available_cameras()
+        except Exception as e:
+            logger.error(f"Camera enumeration failed: {e}")
+            cameras = []
+
+        try:
+            self.signals.finished.emit(cameras)
+        except RuntimeError:
+            # The application quit (and deleted the signals object) while
+            # enumeration was still running
+            pass
+
+
 class ProcessingWorker(QThread):
     """
     Worker thread for camera processing.
@@ -107,9 +167,14 @@ class ProcessingWorker(QThread):
     """
 
     # Signals (thread-safe communication with main thread)
-    frame_processed = pyqtSignal(FrameProcessingResult)
+    # Per-frame stats as primitives (fps, face_detected): no custom type
+    # is boxed or copied across threads for the status labels
+    frame_stats = pyqtSignal(float, bool)
     error_occurred = pyqtSignal(str)
 
+    # Calibration target/sample/state changed, or calibration ended
+    calibration_changed = pyqtSignal()
+
     def __init__(self, controller: Controller, parent=None):
         """
         Initialize worker.
@@ -120,37 +185,70 @@ class ProcessingWorker(QThread):
         """
         super().__init__(parent)
         self._controller = controller
-        self._running = False
+
+        # Cleared by stop(); set here rather than in run() so a stop()
+        # issued before the thread is scheduled is not overwritten
+        self._running = True
+
+        # Set when the controller state changes (or on stop)
+        self._wake = threading.Event()
+
+        # Wake the loop on controller state changes. The loop re-reads
+        # controller.state itself (a lock-free attribute load), so a late
+        # or reordered notification cannot leave it acting on a stale state
+        controller.set_state_listener(self._on_state_changed)
+
+        # Time of last frame_stats emission (throttling)
+        self._last_emit = 0.0
 
     def run(self):
         """
         Worker thread main loop.
 
         Processes frames and emits results via signals.
+        Blocks without polling while not tracking or calibrating.
         """
         logger.info("Processing worker started")
-        self._running = True
+
+        if sys.getswitchinterval() < _DEFAULT_SWITCH_INTERVAL:
+            logger.warning(
+                f"GIL switch interval lowered to {sys.getswitchinterval()}s; "
+                "worker/UI contention will increase"
+            )
 
         try:
             while self._running:
                 # Check if we should be processing
                 state = self._controller.state
 
-                if state in (AppState.TRACKING, AppState.CALIBRATING):
-                    # Process frame
+                if state in ACTIVE_STATES:
+                    # Process frame (camera read blocks until the next
+                    # frame, so this loop is paced by the camera)
                     result = self._controller.process_frame()
 
-                    # Emit result to UI thread
-                    self.frame_processed.emit(result)
+                    if state == AppState.CALIBRATING and self._controller.state != state:
+                        # Calibration finished or failed this frame
+                        self.calibration_changed.emit()
+
+                    if result is NO_FRAME:
+                        # Camera read failed: back off instead of spinning
+                        self._wake.wait(_FRAME_RETRY_DELAY)
+                        self._wake.clear()
+                        continue
 
-                elif state == AppState.PAUSED:
-                    # Camera open but not processing
-                    # Just sleep to avoid busy loop
-                    time.sleep(0.03)  # ~30fps polling
+                    # Emit stats to UI thread, coalesced to _EMIT_INTERVAL
+                    # (intermediate results are dropped; the calibration
+                    # overlay has its own calibration_changed signal)
+                    now = time.monotonic()
+                    if now - self._last_emit >= _EMIT_INTERVAL:
+                        self._last_emit = now
+                        self.frame_stats.emit(result.fps, result.face_detected)
 
                 else:
-                    # Idle or error state
-                    time.sleep(0.1)
+                    # Idle, paused or error: sleep until notified (the
+                    # state is re-read after clearing, so no change is missed)
+                    self._wake.wait()
+                    self._wake.clear()
 
         except Exception as e:
             logger.error(f"Worker thread error: {e}")
@@ -158,9 +256,14 @@ class ProcessingWorker(QThread):
 
         logger.info("Processing worker stopped")
 
+    def _on_state_changed(self, state: AppState):
+        """Wake the loop to re-read the controller state."""
+        self._wake.set()
+
     def stop(self):
         """Stop the worker thread."""
         self._running = False
+        self._wake.set()
 
 
 class MainWindow(QMainWindow):
@@ -170,6 +273,10 @@ class MainWindow(QMainWindow):
     Professional UI with comprehensive safety controls.
     """
 
+    # Face status styles (neutral colors: no face is not an error)
+    _FACE_STYLE_DETECTED = "color: #666;"
+    _FACE_STYLE_NONE = "color: #999;"
+
     def __init__(self, config: AppConfig):
         """
         Initialize main window.
@@ -192,8 +299,9 @@ class MainWindow(QMainWindow):
         # Initialize controller (camera index set later)
         self._controller: Controller = None
 
-        # Available cameras
-        self._available_cameras = list_available_cameras()
+        # Available cameras (filled in asynchronously; see _start_camera_listing)
+        self._available_cameras: list[int] = []
+        self._camera_list_task: Optional[_ListCamerasTask] = None
 
         # Worker thread
         self._worker: ProcessingWorker = None
@@ -201,14 +309,20 @@ class MainWindow(QMainWindow):
         # Calibration overlay
         self._calibration_overlay: CalibrationTargetWidget = None
 
+        # Calibration explanation dialog (built on first use, then reused)
+        self._calibration_dialog: CalibrationDialog = None
+
+        # Message boxes by (icon, title), built on first use, then reused
+        self._message_boxes: dict[tuple[QMessageBox.Icon, str], QMessageBox] = {}
+
+        # Last values shown in the status labels, so unchanged frames
+        # skip setText/setStyleSheet (a stylesheet set re-polishes the widget)
+        self._last_face_detected: Optional[bool] = None
+        self._last_fps_bucket = -1
+
         # UI setup
         self._init_ui()
 
-        # Timer for UI updates during calibration
-        self._calibration_timer = QTimer(self)
-        self._calibration_timer.timeout.connect(self._update_calibration_ui)
-        self._calibration_timer.setInterval(100)  # 10 Hz
-
         # Keyboard shortcut for emergency toggle
         self._setup_keyboard_shortcuts()
 
@@ -220,9 +334,11 @@ class MainWindow(QMainWindow):
 
     def _init_ui(self):
         """Initialize UI components."""
-        self.setWindowTitle(self._config.ui.window_title)
-        self.setGeometry(100, 100, self._config.ui.window_width, self._config.ui.window_height)
-        self.setMinimumSize(self._config.ui.window_min_width, self._config.ui.window_min_height)
+        ui = self._config.ui
+
+        self.setWindowTitle(ui.window_title)
+        self.setGeometry(100, 100, ui.window_width, ui.window_height)
+        self.setMinimumSize(ui.window_min_width, ui.window_min_height)
 
         # Central widget
         central_widget = QWidget()
@@ -230,13 +346,9 @@ class MainWindow(QMainWindow):
 
         # Main layout
         main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(
-            self._config.ui.content_margin,
-            self._config.ui.content_margin,
-            self._config.ui.content_margin,
-            self._config.ui.content_margin,
-        )
-        main_layout.setSpacing(self._config.ui.group_spacing)
+        margin = ui.content_margin
+        main_layout.setContentsMargins(margin, margin, margin, margin)
+        main_layout.setSpacing(ui.group_spacing)
 
         # Tracking status and control (PRIMARY - most important)
         tracking_section = self._create_tracking_section()
@@ -258,17 +370,32 @@ class MainWindow(QMainWindow):
         sensitivity_section = self._create_sensitivity_section()
         main_layout.addWidget(sensitivity_section)
 
-        # Data management (less prominent)
-        data_section = self._create_data_section()
-        main_layout.addWidget(data_section)
+        # Data management (less prominent); built after first paint
+        self._data_section = QWidget()
+        main_layout.addWidget(self._data_section)
 
         # Stretch to push everything up
         main_layout.addStretch()
 
-        # Subtle privacy notice at bottom (dismissible)
-        self._privacy_notice = self._create_privacy_notice()
+        # Subtle privacy notice at bottom (dismissible); built after first paint
+        self._privacy_notice = QWidget()
         main_layout.addWidget(self._privacy_notice)
 
+        self._main_layout = main_layout
+        QTimer.singleShot(0, self._build_deferred_ui)
+
+    def _build_deferred_ui(self):
+        """Replace the secondary-section placeholders once the window is up."""
+        data_section = self._create_data_section()
+        self._main_layout.replaceWidget(self._data_section, data_section)
+        self._data_section.deleteLater()
+        self._data_section = data_section
+
+        privacy_notice = self._create_privacy_notice()
+        self._main_layout.replaceWidget(self._privacy_notice, privacy_notice)
+        self._privacy_notice.deleteLater()
+        self._privacy_notice = privacy_notice
+
     def _create_privacy_notice(self) -> QWidget:
         """Create subtle dismissible privacy notice at bottom."""
         container = QWidget()
@@ -305,17 +432,16 @@ class MainWindow(QMainWindow):
         camera_layout = QHBoxLayout()
 
         self._camera_combo = QComboBox()
-        if self._available_cameras:
-            for cam_idx in self._available_cameras:
-                self._camera_combo.addItem(f"Camera {cam_idx}", cam_idx)
-        else:
-            self._camera_combo.addItem("No camera detected", -1)
+        self._camera_combo.addItem("Detecting cameras...", -1)
+        self._camera_combo.setEnabled(False)
+        self._start_camera_listing()
 
         camera_layout.addWidget(self._camera_combo)
 
         self._test_camera_btn = QPushButton("Test")
         self._test_camera_btn.setStyleSheet("color: #666; font-size: 9pt;")
         self._test_camera_btn.clicked.connect(self._on_test_camera_clicked)
+        self._test_camera_btn.setEnabled(False)  # Until cameras are listed
         camera_layout.addWidget(self._test_camera_btn)
 
         camera_layout.addStretch()
@@ -323,6 +449,30 @@ class MainWindow(QMainWindow):
 
         return container
 
+    def _start_camera_listing(self):
+        """Enumerate cameras on the thread pool; see _on_cameras_listed."""
+        self._camera_list_task = _ListCamerasTask()
+        self._camera_list_task.signals.finished.connect(
+            self._on_cameras_listed, Qt.ConnectionType.QueuedConnection
+        )
+        QThreadPool.globalInstance().start(self._camera_list_task)
+
+    def _on_cameras_listed(self, cameras: list):
+        """Populate the camera selector once enumeration finishes."""
+        self._available_cameras = cameras
+        self._camera_list_task = None
+
+        self._camera_combo.clear()
+        if cameras:
+            for cam_idx in cameras:
+                self._camera_combo.addItem(f"Camera {cam_idx}", cam_idx)
+            self._camera_combo.setEnabled(True)
+        else:
+            self._camera_combo.addItem("No camera detected", -1)
+
+        self._test_camera_btn.setEnabled(True)
+        self._update_button_states()
+
     def _create_status_section(self) -> QWidget:
         """Create status display (no group box, cleaner)."""
         container = QWidget()
@@ -387,6 +537,7 @@ class MainWindow(QMainWindow):
         # Calibration button
         self._calibrate_btn = QPushButton("Calibrate")
         self._calibrate_btn.clicked.connect(self._on_calibrate_clicked)
+        self._calibrate_btn.setEnabled(False)  # Until cameras are listed
         layout.addWidget(self._calibrate_btn)
 
         # Tracking buttons
@@ -474,7 +625,10 @@ class MainWindow(QMainWindow):
             True if successful
         """
         # Update config with selected camera
-        self._config.camera.camera_index = camera_index
+        self._config = replace(
+            self._config,
+            camera=replace(self._config.camera, camera_index=camera_index),
+        )
 
         # Create controller
         self._controller = Controller(
@@ -484,8 +638,8 @@ class MainWindow(QMainWindow):
         )
 
         if not self._controller.initialize():
-            QMessageBox.critical(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Critical,
                 "Initialization Error",
                 "Failed to initialize VisionCursor. Check that the camera is available and not in use by another application.",
             )
@@ -499,19 +653,62 @@ class MainWindow(QMainWindow):
     def _start_worker(self):
         """Start processing worker thread."""
         self._worker = ProcessingWorker(self._controller)
-        self._worker.frame_processed.connect(self._on_frame_processed)
-        self._worker.error_occurred.connect(self._on_worker_error)
+        # Worker signals are always emitted from the worker thread, so queue
+        # them explicitly rather than letting Qt decide per emission
+        self._worker.frame_stats.connect(
+            self._on_frame_stats, Qt.ConnectionType.QueuedConnection
+        )
+        self._worker.error_occurred.connect(
+            self._on_worker_error, Qt.ConnectionType.QueuedConnection
+        )
+
+        # Calibration overlay redraws on calibrator events (queued, so
+        # events raised on either thread are handled in the UI thread)
+        self._worker.calibration_changed.connect(
+            self._update_calibration_ui, Qt.ConnectionType.QueuedConnection
+        )
+        self._controller.calibrator.set_listener(self._worker.calibration_changed.emit)
         self._worker.start()
 
         logger.info("Worker thread started")
 
+    def _show_message(
+        self,
+        icon: QMessageBox.Icon,
+        title: str,
+        text: str,
+        buttons: QMessageBox.StandardButton = QMessageBox.StandardButton.Ok,
+    ) -> QMessageBox.StandardButton:
+        """
+        Show a modal message box, reusing the one built for this icon/title.
+
+        Args:
+            icon: Message box icon
+            title: Window title
+            text: Message text
+            buttons: Standard buttons to offer
+
+        Returns:
+            The button the user clicked
+        """
+        key = (icon, title)
+        box = self._message_boxes.get(key)
+        if box is None:
+            box = QMessageBox(icon, title, text, buttons, self)
+            self._message_boxes[key] = box
+        else:
+            box.setText(text)
+            box.setStandardButtons(buttons)
+
+        return QMessageBox.StandardButton(box.exec())
+
     def _on_test_camera_clicked(self):
         """Test camera access."""
         camera_index = self._camera_combo.currentData()
 
         if camera_index < 0:
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "No Camera",
                 "No cameras were detected. Please connect a camera and restart the application.",
             )
@@ -522,8 +719,8 @@ class MainWindow(QMainWindow):
             if not self._initialize_controller(camera_index):
                 return
 
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Icon.Information,
             "Camera Test",
             f"Camera {camera_index} is accessible and ready for use.\n\n"
             "You can now proceed with calibration.",
@@ -535,8 +732,8 @@ class MainWindow(QMainWindow):
         if self._controller is None:
             camera_index = self._camera_combo.currentData()
             if camera_index < 0:
-                QMessageBox.warning(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Warning,
                     "No Camera",
                     "Please select a valid camera before calibrating.",
                 )
@@ -546,14 +743,16 @@ class MainWindow(QMainWindow):
                 return
 
         # Show calibration explanation dialog
-        dialog = CalibrationDialog(self)
-        if dialog.exec() != QDialog.DialogCode.Accepted:
+        if self._calibration_dialog is None:
+            self._calibration_dialog = CalibrationDialog(self)
+
+        if self._calibration_dialog.exec() != QDialog.DialogCode.Accepted:
             return  # User cancelled
 
         # Start calibration
         if self._controller.start_calibration():
             self._show_calibration_overlay()
-            self._calibration_timer.start()
+            self._update_calibration_ui()
             self._update_button_states()
 
     def _on_start_clicked(self):
@@ -564,8 +763,8 @@ class MainWindow(QMainWindow):
         else:
             # Show error if no calibration
             if not self._controller.has_calibration:
-                QMessageBox.warning(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Warning,
                     "No Calibration",
                     "Please calibrate the system before starting tracking.",
                 )
@@ -634,8 +833,8 @@ class MainWindow(QMainWindow):
 
     def _on_delete_calibration_clicked(self):
         """Handle delete calibration button click."""
-        reply = QMessageBox.question(
-            self,
+        reply = self._show_message(
+            QMessageBox.Icon.Question,
             "Delete Calibration",
             "Are you sure you want to delete calibration data?\n\n"
             "You will need to calibrate again before using cursor tracking.",
@@ -646,35 +845,44 @@ class MainWindow(QMainWindow):
             if self._controller:
                 self._controller.delete_calibration()
 
-            QMessageBox.information(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Information,
                 "Calibration Deleted",
                 "Calibration data has been deleted successfully.",
             )
             self._update_button_states()
 
-    def _on_frame_processed(self, result: FrameProcessingResult):
+    def _on_frame_stats(self, fps: float, face_detected: bool):
         """
-        Handle frame processing result from worker.
+        Handle per-frame stats from worker.
 
         Called in main thread via signal.
-        """
-        # Update FPS
-        self._fps_label.setText(f"FPS: {result.fps:.1f}")
 
-        # Update face detection status (neutral colors)
-        if result.face_detected:
-            self._face_label.setText("Face: Detected")
-            self._face_label.setStyleSheet("color: #666;")  # Neutral, not bright green
-        else:
-            self._face_label.setText("Face: Not detected")
-            self._face_label.setStyleSheet("color: #999;")  # Grey, not red (not an error)
+        Args:
+            fps: Current processing FPS
+            face_detected: Whether a face was detected in the frame
+        """
+        # Update FPS (only when the displayed tenth changes)
+        fps_bucket = round(fps * 10)  # Rounded, as the label is
+        if fps_bucket != self._last_fps_bucket:
+            self._last_fps_bucket = fps_bucket
+            self._fps_label.setText(f"FPS: {fps:.1f}")
+
+        # Update face detection status (neutral colors) on change only
+        if face_detected != self._last_face_detected:
+            self._last_face_detected = face_detected
+            if face_detected:
+                self._face_label.setText("Face: Detected")
+                self._face_label.setStyleSheet(self._FACE_STYLE_DETECTED)
+            else:
+                self._face_label.setText("Face: Not detected")
+                self._face_label.setStyleSheet(self._FACE_STYLE_NONE)
 
     def _on_worker_error(self, error_msg: str):
         """Handle worker thread error."""
         logger.error(f"Worker error: {error_msg}")
-        QMessageBox.critical(
-            self,
+        self._show_message(
+            QMessageBox.Icon.Critical,
             "Processing Error",
             f"An error occurred during processing:\n{error_msg}\n\n"
             "Please check that the camera is connected and accessible.",
@@ -699,9 +907,8 @@ class MainWindow(QMainWindow):
             self._calibration_overlay.hide()
 
     def _update_calibration_ui(self):
-        """Update calibration UI (called by timer)."""
+        """Update calibration UI (called on calibration events)."""
         if self._controller.state != AppState.CALIBRATING:
-            self._calibration_timer.stop()
             self._hide_calibration_overlay()
             self._update_button_states()
             return
@@ -731,7 +938,7 @@ class MainWindow(QMainWindow):
             self._calibration_overlay.set_countdown("Get ready...")
         elif calibrator.state == CalibrationState.COLLECTING:
             # Show progress
-            samples = len(target.samples)
+            samples = target.sample_count
             total_samples = self._config.calibration.samples_per_point
             progress_text = f"Collecting... ({samples}/{total_samples})"
             self._calibration_overlay.set_countdown(progress_text)
@@ -741,8 +948,8 @@ class MainWindow(QMainWindow):
     def _update_button_states(self):
         """Update button enabled/disabled states based on current state."""
         if self._controller is None:
-            # Before controller initialization
-            self._calibrate_btn.setEnabled(True)
+            # Before controller initialization (and camera detection)
+            self._calibrate_btn.setEnabled(self._camera_list_task is None)
             self._start_btn.setEnabled(False)
             self._pause_btn.setEnabled(False)
             self._stop_btn.setEnabled(False)
@@ -3,8 +3,8 @@ Custom GUI widgets for VisionCursor.
 """
 
 from PyQt6.QtWidgets import QWidget, QLabel
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QImage, QPixmap, QPainter, QPen, QColor
+from PyQt6.QtCore import Qt, QSize, QRect
+from PyQt6.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QFont
 import numpy as np
 
 
@@ -34,6 +34,12 @@ class CameraPreviewWidget(QWidget):
 
         self._current_pixmap: QPixmap = None
 
+        # Aspect-fit destination for the pixmap (recomputed on size change)
+        self._target_rect = QRect()
+
+        # Placeholder text color (built once, not per paint)
+        self._placeholder_color = QColor(128, 128, 128)
+
     def update_frame(self, frame: np.ndarray):
         """
         Update preview with new frame.
@@ -49,7 +55,14 @@ class CameraPreviewWidget(QWidget):
         try:
             height, width, channels = frame.shape
 
-            # Convert numpy array to QImage
+            # QImage reads the buffer as packed rows. Camera buffers are
+            # C-contiguous by construction, so a strided view (e.g.
+            # frame[:, :, ::-1]) is a caller bug, not something to paper
+            # over with a per-frame copy
+            if not frame.flags.c_contiguous:
+                return
+
+            # Wrap numpy array as QImage (no copy)
             bytes_per_line = channels * width
             q_image = QImage(
                 frame.data,
@@ -59,33 +72,46 @@ class CameraPreviewWidget(QWidget):
                 QImage.Format.Format_RGB888,
             )
 
-            # Scale to preview size
-            scaled_image = q_image.scaled(
-                self._preview_width,
-                self._preview_height,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-
-            self._current_pixmap = QPixmap.fromImage(scaled_image)
+            # Keep the pixmap at camera resolution; scaling happens in the
+            # paint engine at draw time (see paintEvent). Convert into the
+            # existing pixmap when the size is unchanged.
+            if (self._current_pixmap is not None
+                    and self._current_pixmap.size() == q_image.size()):
+                self._current_pixmap.convertFromImage(q_image)
+            else:
+                self._current_pixmap = QPixmap.fromImage(q_image)
+                self._update_target_rect()
             self.update()  # Trigger repaint
 
         except Exception as e:
             # Silently fail on invalid frames
             pass
 
+    def _update_target_rect(self):
+        """Fit the pixmap inside the widget, keeping aspect ratio, centered."""
+        size = self._current_pixmap.size().scaled(
+            self.size(), Qt.AspectRatioMode.KeepAspectRatio
+        )
+        x = (self.width() - size.width()) // 2
+        y = (self.height() - size.height()) // 2
+        self._target_rect = QRect(x, y, size.width(), size.height())
+
+    def resizeEvent(self, event):
+        """Refit the pixmap when the widget size changes."""
+        super().resizeEvent(event)
+        if self._current_pixmap:
+            self._update_target_rect()
+
     def paintEvent(self, event):
         """Paint the preview."""
         painter = QPainter(self)
 
         if self._current_pixmap:
-            # Center the pixmap
-            x = (self.width() - self._current_pixmap.width()) // 2
-            y = (self.height() - self._current_pixmap.height()) // 2
-            painter.drawPixmap(x, y, self._current_pixmap)
+            # Paint engine scales the full-resolution pixmap into place
+            painter.drawPixmap(self._target_rect, self._current_pixmap)
         else:
             # Draw placeholder text
-            painter.setPen(QColor(128, 128, 128))
+            painter.setPen(self._placeholder_color)
             painter.drawText(
                 self.rect(),
                 Qt.AlignmentFlag.AlignCenter,
@@ -115,6 +141,21 @@ class CalibrationTargetWidget(QWidget):
         self._instruction_text = ""
         self._countdown_text = ""
 
+        # Paint resources (built once, not per paint)
+        self._outer_pen = QPen(QColor(255, 255, 255), 3)
+        self._outer_brush = QColor(255, 255, 255)
+        self._inner_pen = QPen(QColor(255, 0, 0), 2)
+        self._inner_brush = QColor(255, 0, 0)
+        self._instruction_color = QColor(255, 255, 255)
+        self._countdown_color = QColor(255, 255, 0)
+
+        self._instruction_font = QFont(self.font())
+        self._instruction_font.setPointSize(16)
+
+        self._countdown_font = QFont(self.font())
+        self._countdown_font.setPointSize(48)
+        self._countdown_font.setBold(True)
+
     def set_target(self, x: float, y: float, size: int = 20):
         """
         Set target position.
@@ -123,25 +164,40 @@ class CalibrationTargetWidget(QWidget):
             x: Target x position (pixels)
             y: Target y position (pixels)
             size: Target size (pixels)
+
+        Unchanged values do not schedule a repaint (the overlay is
+        refreshed on every calibration sample).
         """
-        self._target_x = int(x)
-        self._target_y = int(y)
+        x = int(x)
+        y = int(y)
+        if (self._target_visible and x == self._target_x
+                and y == self._target_y and size == self._target_size):
+            return
+
+        self._target_x = x
+        self._target_y = y
         self._target_size = size
         self._target_visible = True
         self.update()
 
     def set_instruction(self, text: str):
         """Set instruction text."""
+        if text == self._instruction_text:
+            return
         self._instruction_text = text
         self.update()
 
     def set_countdown(self, text: str):
         """Set countdown text."""
+        if text == self._countdown_text:
+            return
         self._countdown_text = text
         self.update()
 
     def hide_target(self):
         """Hide the target."""
+        if not self._target_visible:
+            return
         self._target_visible = False
         self.update()
 
@@ -153,8 +209,8 @@ class CalibrationTargetWidget(QWidget):
         # Draw target if visible
         if self._target_visible:
             # Outer circle (white)
-            painter.setPen(QPen(QColor(255, 255, 255), 3))
-            painter.setBrush(QColor(255, 255, 255))
+            painter.setPen(self._outer_pen)
+            painter.setBrush(self._outer_brush)
             painter.drawEllipse(
                 self._target_x - self._target_size,
                 self._target_y - self._target_size,
@@ -163,8 +219,8 @@ class CalibrationTargetWidget(QWidget):
             )
 
             # Inner circle (red)
-            painter.setPen(QPen(QColor(255, 0, 0), 2))
-            painter.setBrush(QColor(255, 0, 0))
+            painter.setPen(self._inner_pen)
+            painter.setBrush(self._inner_brush)
             painter.drawEllipse(
                 self._target_x - self._target_size // 2,
                 self._target_y - self._target_size // 2,
@@ -174,10 +230,8 @@ class CalibrationTargetWidget(QWidget):
 
         # Draw instruction text at top
         if self._instruction_text:
-            painter.setPen(QColor(255, 255, 255))
-            font = painter.font()
-            font.setPointSize(16)
-            painter.setFont(font)
+            painter.setPen(self._instruction_color)
+            painter.setFont(self._instruction_font)
 
             painter.drawText(
                 0,
@@ -190,11 +244,8 @@ class CalibrationTargetWidget(QWidget):
 
         # Draw countdown text near target
         if self._countdown_text and self._target_visible:
-            painter.setPen(QColor(255, 255, 0))
-            font = painter.font()
-            font.setPointSize(48)
-            font.setBold(True)
-            painter.setFont(font)
+            painter.setPen(self._countdown_color)
+            painter.setFont(self._countdown_font)
 
             painter.drawText(
                 self._target_x - 100,
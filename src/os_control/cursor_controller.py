@@ -1,7 +1,8 @@
 """
 Cursor control with safety mechanisms.
 
-Uses pynput for cross-platform cursor control.
+Uses pynput for cross-platform cursor control; on Windows, moves go
+straight to user32.SetCursorPos (the call pynput makes underneath).
 Includes rate limiting and bounds checking for safety.
 
 Why pynput over pyautogui:
@@ -11,8 +12,11 @@ Why pynput over pyautogui:
 - More suitable for real-time cursor control
 """
 
+import ctypes
+import logging
+import sys
 import time
-from typing import Tuple, Optional
+from typing import Callable, Tuple, Optional
 from pynput.mouse import Controller as MouseController
 
 from src.utils.logger import get_logger
@@ -26,6 +30,26 @@ class CursorControlError(Exception):
     pass
 
 
+def _native_set_cursor_pos() -> Optional[Callable[[int, int], int]]:
+    """
+    Look up the platform's set-cursor-position call, if bound directly.
+
+    Returns:
+        user32.SetCursorPos on Windows, None elsewhere (pynput is used)
+    """
+    if sys.platform != "win32":
+        return None
+
+    try:
+        set_cursor_pos = ctypes.WinDLL("user32").SetCursorPos
+        set_cursor_pos.argtypes = (ctypes.c_int, ctypes.c_int)
+        set_cursor_pos.restype = ctypes.c_int
+        return set_cursor_pos
+    except (OSError, AttributeError) as e:
+        logger.warning(f"SetCursorPos unavailable, using pynput: {e}")
+        return None
+
+
 class CursorController:
     """
     Safe cursor control with rate limiting and bounds checking.
@@ -55,11 +79,22 @@ class CursorController:
         self._screen_height = screen_height
         self._min_update_interval = min_update_interval
 
+        # Clamp bounds (inclusive)
+        self._max_x = screen_width - 1
+        self._max_y = screen_height - 1
+
         # pynput mouse controller
         self._mouse = MouseController()
 
-        # Rate limiting
-        self._last_update_time = 0.0
+        # Direct OS call for moves, bound once (None: use pynput)
+        self._set_cursor_pos = _native_set_cursor_pos()
+
+        # pynput position setter, looked up once instead of per move
+        self._position_set = type(self._mouse).position.fset
+
+        # Rate limiting (integer nanoseconds; next allowed update time)
+        self._min_update_interval_ns = int(min_update_interval * 1e9)
+        self._next_update_ns = 0
 
         # Emergency stop flag
         self._enabled = True
@@ -93,23 +128,31 @@ class CursorController:
             return False
 
         # Rate limiting
-        current_time = time.perf_counter()
-        if current_time - self._last_update_time < self._min_update_interval:
+        now_ns = time.monotonic_ns()
+        if now_ns < self._next_update_ns:
             self._skipped_moves += 1
             return False
 
         # Bounds checking
-        x_clamped = max(0, min(x, self._screen_width - 1))
-        y_clamped = max(0, min(y, self._screen_height - 1))
+        max_x = self._max_x
+        max_y = self._max_y
+        x_clamped = 0 if x < 0 else (max_x if x > max_x else x)
+        y_clamped = 0 if y < 0 else (max_y if y > max_y else y)
 
-        if x != x_clamped or y != y_clamped:
-            logger.debug(f"Cursor position clamped: ({x},{y}) -> ({x_clamped},{y_clamped})")
+        if (x != x_clamped or y != y_clamped) and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Cursor position clamped: (%d,%d) -> (%d,%d)", x, y, x_clamped, y_clamped
+            )
 
         try:
             # Move cursor
-            self._mouse.position = (x_clamped, y_clamped)
+            if self._set_cursor_pos is not None:
+                if not self._set_cursor_pos(x_clamped, y_clamped):
+                    raise CursorControlError("SetCursorPos failed")
+            else:
+                self._position_set(self._mouse, (x_clamped, y_clamped))
 
-            self._last_update_time = current_time
+            self._next_update_ns = now_ns + self._min_update_interval_ns
             self._total_moves += 1
 
             return True
@@ -156,6 +199,8 @@ class CursorController:
         """
         self._screen_width = width
         self._screen_height = height
+        self._max_x = width - 1
+        self._max_y = height - 1
         logger.info(f"Screen size updated: {width}x{height}")
 
     def reset_statistics(self):
@@ -9,9 +9,15 @@ Privacy & Security:
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used instead
+    orjson = None
+
 from src.core.config import StorageConfig
 from src.storage.schema import CalibrationData
 from src.utils.logger import get_logger
@@ -19,6 +25,24 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _dumps(calibration: CalibrationData) -> bytes:
+    """Serialize calibration data to indented UTF-8 JSON."""
+    if orjson is not None:
+        # Point columns go through orjson's native numpy serializer
+        return orjson.dumps(
+            calibration.to_dict(as_arrays=True),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(calibration.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> dict:
+    """Parse UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class CalibrationStoreError(Exception):
     """Calibration storage errors."""
 
@@ -50,14 +74,11 @@ class CalibrationStore:
         """
         self._config = config
 
-        # Validate and resolve storage path (prevent traversal attacks)
-        try:
-            self._data_dir = config.data_dir.resolve(strict=False)
-            self._data_dir.mkdir(parents=True, exist_ok=True)
-        except (RuntimeError, OSError) as e:
-            raise CalibrationStoreError(f"Invalid storage path: {e}")
-
-        self._calibration_path = self._data_dir / config.calibration_filename
+        # StorageConfig has already created, symlink-checked and
+        # canonicalized the data directory, so it is not resolved again
+        self._data_dir = config.data_dir
+        self._calibration_path = config.calibration_path
+        self._temp_path = self._calibration_path.with_suffix(".tmp")
 
         # Ensure we're still within the intended directory
         if not self._is_safe_path(self._calibration_path):
@@ -82,19 +103,20 @@ class CalibrationStore:
             # Validate before saving
             calibration.validate()
 
-            # Convert to dictionary
-            data_dict = calibration.to_dict()
-
-            # Write to temporary file first (atomic write)
-            temp_path = self._calibration_path.with_suffix(".tmp")
+            data = _dumps(calibration)
 
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(data_dict, f, indent=2, ensure_ascii=False)
+            if self._config.atomic_write:
+                # Write to temporary file first (atomic write)
+                with open(self._temp_path, "wb") as f:
+                    f.write(data)
 
-            # Atomic replace
-            temp_path.replace(self._calibration_path)
+                # Atomic replace
+                self._temp_path.replace(self._calibration_path)
+            else:
+                with open(self._calibration_path, "wb") as f:
+                    f.write(data)
 
-            logger.info(f"Calibration saved: {len(calibration.points)} points")
+            logger.info("Calibration saved: %d points", len(calibration.points))
             return True
 
         except Exception as e:
@@ -117,17 +139,17 @@ class CalibrationStore:
             return None
 
         try:
-            with open(self._calibration_path, "r", encoding="utf-8") as f:
-                data_dict = json.load(f)
+            with open(self._calibration_path, "rb") as f:
+                data_dict = _loads(f.read())
 
             # Parse and validate
             calibration = CalibrationData.from_dict(data_dict)
             calibration.validate()
 
-            logger.info(f"Calibration loaded: {len(calibration.points)} points")
+            logger.info("Calibration loaded: %d points", len(calibration.points))
             return calibration
 
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
             error_msg = f"Corrupted calibration file: {e}"
             logger.error(error_msg)
             raise CalibrationStoreError(error_msg) from e
@@ -175,14 +197,19 @@ class CalibrationStore:
         """
         Check if path is safe (within data directory).
 
+        The data directory is already canonical, so the path is safe when
+        it is a plain file name directly inside it and not a symlink. This
+        avoids resolve(), which lstat()s every component of the path.
+
         Args:
             path: Path to check
 
         Returns:
             True if safe, False if potential traversal attack
         """
-        try:
-            resolved = path.resolve(strict=False)
-            return resolved.parent == self._data_dir
-        except (RuntimeError, OSError):
+        name = path.name
+        if path.parent != self._data_dir or name in ("", ".", ".."):
+            return False
+        if os.sep in name or (os.altsep and os.altsep in name):
             return False
+        return not os.path.islink(path)
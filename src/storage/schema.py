@@ -5,8 +5,8 @@ Privacy: Only stores numeric calibration parameters,
 no biometric data, no images, no personal information.
 """
 
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Any, Optional
 import numpy as np
 from datetime import datetime
 
@@ -14,8 +14,13 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Current on-disk schema. 1.1 stores points as parallel arrays
+# (screen_xy, gaze_xy, sample_counts); 1.0 stored a list of point dicts
+# and is still read.
+SCHEMA_VERSION = "1.1"
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CalibrationPoint:
     """
     Single calibration point data.
@@ -68,16 +73,19 @@ class CalibrationPoint:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class CalibrationData:
     """
     Complete calibration dataset.
 
     Privacy: Contains only numeric mapping parameters.
+
+    Slotted but not frozen: __post_init__ fills defaults and validate()
+    records what it last accepted on the instance.
     """
 
     # Schema version for future compatibility
-    version: str = "1.0"
+    version: str = SCHEMA_VERSION
 
     # Timestamp of calibration
     timestamp: str = ""
@@ -89,6 +97,12 @@ class CalibrationData:
     # Calibration points (typically 5: center, left, right, top, bottom)
     points: List[CalibrationPoint] = None
 
+    # Snapshot of the fields last accepted by validate(); a later call on
+    # unchanged data returns immediately, any change is re-checked
+    _validated_key: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Initialize default values."""
         if self.points is None:
@@ -97,20 +111,67 @@ class CalibrationData:
         if not self.timestamp:
             self.timestamp = datetime.now().isoformat()
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+    def to_dict(self, as_arrays: bool = False) -> Dict[str, Any]:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Points are stored column-wise as screen_xy, gaze_xy and
+        sample_counts rather than one keyed dict per point.
+
+        Args:
+            as_arrays: Return the point columns as numpy arrays (for a
+                serializer with a numpy fast path) instead of lists
+
+        Returns:
+            Dictionary in the current schema layout
+        """
+        n = len(self.points)
+        screen_xy = np.fromiter(
+            (v for p in self.points for v in (p.screen_x, p.screen_y)),
+            dtype=np.float64,
+            count=2 * n,
+        ).reshape(n, 2)
+        gaze_xy = np.fromiter(
+            (v for p in self.points for v in (p.gaze_x, p.gaze_y)),
+            dtype=np.float64,
+            count=2 * n,
+        ).reshape(n, 2)
+        sample_counts = np.fromiter(
+            (p.sample_count for p in self.points), dtype=np.int64, count=n
+        )
+
+        if not as_arrays:
+            screen_xy = screen_xy.tolist()
+            gaze_xy = gaze_xy.tolist()
+            sample_counts = sample_counts.tolist()
+
         return {
-            "version": self.version,
+            # Always the current layout, whatever version was loaded
+            "version": SCHEMA_VERSION,
             "timestamp": self.timestamp,
             "screen_width": self.screen_width,
             "screen_height": self.screen_height,
-            "points": [point.to_dict() for point in self.points],
+            "screen_xy": screen_xy,
+            "gaze_xy": gaze_xy,
+            "sample_counts": sample_counts,
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CalibrationData":
-        """Create from dictionary."""
-        points = [CalibrationPoint.from_dict(p) for p in data.get("points", [])]
+        """Create from dictionary (column layout, or the 1.0 list of points)."""
+        if "gaze_xy" in data:
+            n = len(data["screen_xy"])
+            if len(data["gaze_xy"]) != n or len(data["sample_counts"]) != n:
+                raise ValueError("Calibration point columns differ in length")
+
+            points = [
+                CalibrationPoint(float(sx), float(sy), float(gx), float(gy), int(count))
+                for (sx, sy), (gx, gy), count in zip(
+                    data["screen_xy"], data["gaze_xy"], data["sample_counts"]
+                )
+            ]
+        else:
+            points = [CalibrationPoint.from_dict(p) for p in data.get("points", [])]
 
         return cls(
             version=data.get("version", "1.0"),
@@ -126,7 +187,23 @@ class CalibrationData:
 
         Returns:
             True if valid, raises ValueError if invalid
+
+        Note:
+            The result is memoized on a snapshot of the fields (points are
+            frozen), so the store, the calibrator and GazeMapper can each
+            call this without repeating the per-point checks and timestamp
+            parse, while data modified since the last call is re-checked.
         """
+        key = (
+            self.version,
+            self.timestamp,
+            self.screen_width,
+            self.screen_height,
+            tuple(self.points) if self.points else (),
+        )
+        if key == self._validated_key:
+            return True
+
         # Check version
         if not self.version:
             raise ValueError("Missing version")
@@ -152,7 +229,8 @@ class CalibrationData:
         except ValueError:
             raise ValueError("Invalid timestamp format")
 
-        logger.debug(f"Calibration data validated: {len(self.points)} points")
+        self._validated_key = key
+        logger.debug("Calibration data validated: %d points", len(self.points))
         return True
 
     def is_compatible_with_screen(self, width: int, height: int) -> bool:
@@ -175,10 +253,12 @@ class CalibrationData:
         Returns:
             Array of shape (N, 2) with gaze vectors
         """
-        return np.array(
-            [[p.gaze_x, p.gaze_y] for p in self.points],
+        n = len(self.points)
+        return np.fromiter(
+            (v for p in self.points for v in (p.gaze_x, p.gaze_y)),
             dtype=np.float32,
-        )
+            count=2 * n,
+        ).reshape(n, 2)
 
     def get_screen_array(self) -> np.ndarray:
         """
@@ -187,7 +267,9 @@ class CalibrationData:
         Returns:
             Array of shape (N, 2) with screen coordinates
         """
-        return np.array(
-            [[p.screen_x, p.screen_y] for p in self.points],
+        n = len(self.points)
+        return np.fromiter(
+            (v for p in self.points for v in (p.screen_x, p.screen_y)),
             dtype=np.float32,
-        )
+            count=2 * n,
+        ).reshape(n, 2)
@@ -0,0 +1,28 @@
+"""
+Image size helpers.
+"""
+
+from typing import Tuple
+
+
+def fit_within(width: int, height: int, max_size: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Compute the size to shrink an image to so it fits within max_size.
+
+    The aspect ratio is kept, so only the limiting dimension reaches its
+    maximum. Images that already fit are never enlarged.
+
+    Args:
+        width: Image width
+        height: Image height
+        max_size: (max_width, max_height) bound
+
+    Returns:
+        (width, height) to resize to, or the input size if it already fits
+    """
+    max_width, max_height = max_size
+    scale = min(max_width / width, max_height / height)
+    if scale >= 1.0:
+        return (width, height)
+
+    return (max(1, round(width * scale)), max(1, round(height * scale)))
@@ -7,7 +7,18 @@ Provides consistent logging across the application with privacy-safe defaults.
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
+
+# The log format uses none of thread, process or source location, so skip
+# collecting them for every LogRecord (the stdlib logging HOWTO's
+# "Optimization" settings; _srcfile = None skips the caller stack walk)
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
+# Names of loggers whose handlers have been installed by setup_logger
+_configured: Set[str] = set()
 
 
 def setup_logger(
@@ -30,17 +41,21 @@ def setup_logger(
 
     Returns:
         Configured logger instance
+
+    Note:
+        Runs once per name; later calls return the already-configured
+        logger unchanged.
     """
+    if name in _configured:
+        return logging.getLogger(name)
+    _configured.add(name)
+
     logger = logging.getLogger(name)
 
     # Convert level string to logging constant
     numeric_level = getattr(logging, level.upper(), logging.WARNING)
     logger.setLevel(numeric_level)
 
-    # Prevent duplicate handlers
-    if logger.handlers:
-        return logger
-
     # Console handler - always enabled
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
@@ -11,17 +11,19 @@ class FPSCounter:
     Track and calculate frames per second.
 
     Useful for monitoring camera capture and processing performance.
+    Uses an exponential moving average of instantaneous FPS, so each
+    tick is O(1) with no per-frame history.
     """
 
-    def __init__(self, window_size: int = 30):
+    def __init__(self, alpha: float = 0.1):
         """
         Initialize FPS counter.
 
         Args:
-            window_size: Number of frames to average over
+            alpha: EMA weight of the newest frame (0-1, higher = more responsive)
         """
-        self._window_size = window_size
-        self._frame_times: list[float] = []
+        self._alpha = alpha
+        self._fps = 0.0
         self._last_time: Optional[float] = None
 
     def tick(self) -> float:
@@ -35,15 +37,19 @@ class FPSCounter:
 
         if self._last_time is not None:
             frame_time = current_time - self._last_time
-            self._frame_times.append(frame_time)
 
-            # Keep only last N frames
-            if len(self._frame_times) > self._window_size:
-                self._frame_times.pop(0)
+            if frame_time > 0:
+                instant_fps = 1.0 / frame_time
+
+                if self._fps == 0.0:
+                    # Seed with the first measurement
+                    self._fps = instant_fps
+                else:
+                    self._fps += self._alpha * (instant_fps - self._fps)
 
         self._last_time = current_time
 
-        return self.fps
+        return self._fps
 
     @property
     def fps(self) -> float:
@@ -53,18 +59,11 @@ class FPSCounter:
         Returns:
             Current FPS, or 0.0 if no frames recorded
         """
-        if not self._frame_times:
-            return 0.0
-
-        avg_frame_time = sum(self._frame_times) / len(self._frame_times)
-        if avg_frame_time <= 0:
-            return 0.0
-
-        return 1.0 / avg_frame_time
+        return self._fps
 
     def reset(self):
         """Reset FPS counter."""
-        self._frame_times.clear()
+        self._fps = 0.0
         self._last_time = None
 
 
@@ -73,6 +72,9 @@ class FrameRateLimiter:
     Limit frame processing rate to target FPS.
 
     Helps prevent excessive CPU usage.
+    Frames are scheduled against absolute deadlines, so sleep overshoot
+    does not accumulate into drift; after an overrun the schedule restarts
+    from the current time instead of bursting to catch up.
     """
 
     def __init__(self, target_fps: float):
@@ -84,7 +86,7 @@ class FrameRateLimiter:
         """
         self._target_fps = target_fps
         self._min_frame_time = 1.0 / target_fps if target_fps > 0 else 0.0
-        self._last_frame_time: Optional[float] = None
+        self._next_deadline: Optional[float] = None
 
     def wait(self):
         """
@@ -92,19 +94,19 @@ class FrameRateLimiter:
 
         Call this at the end of each frame processing cycle.
         """
-        current_time = time.perf_counter()
+        now = time.perf_counter()
 
-        if self._last_frame_time is not None:
-            elapsed = current_time - self._last_frame_time
-            sleep_time = self._min_frame_time - elapsed
+        if self._next_deadline is None:
+            self._next_deadline = now + self._min_frame_time
+            return
 
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-                self._last_frame_time = time.perf_counter()
-            else:
-                self._last_frame_time = current_time
+        delay = self._next_deadline - now
+        if delay > 0:
+            time.sleep(delay)
+            self._next_deadline += self._min_frame_time
         else:
-            self._last_frame_time = current_time
+            # Overrun: restart the schedule rather than catching up
+            self._next_deadline = now + self._min_frame_time
 
     @property
     def target_fps(self) -> float:
@@ -124,7 +126,7 @@ class FrameRateLimiter:
 
     def reset(self):
         """Reset timing."""
-        self._last_frame_time = None
+        self._next_deadline = None
 
 
 class Timer:
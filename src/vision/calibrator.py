@@ -6,9 +6,8 @@ Provides guided calibration procedure and gaze-to-screen mapping.
 
 import numpy as np
 from typing import List, Optional, Tuple, Callable
-from dataclasses import dataclass
-from enum import Enum, auto
-from scipy import stats  # For trimmed mean (robust averaging)
+from dataclasses import dataclass, field
+from enum import IntEnum, auto
 
 from src.core.config import CalibrationConfig
 from src.vision.gaze_estimator import GazeVector
@@ -18,8 +17,12 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-class CalibrationState(Enum):
-    """Calibration procedure states."""
+class CalibrationState(IntEnum):
+    """
+    Calibration procedure states.
+
+    IntEnum so the per-sample state check is a plain int compare.
+    """
 
     IDLE = auto()
     COUNTDOWN = auto()  # Countdown before collecting samples
@@ -27,6 +30,30 @@ class CalibrationState(Enum):
     COMPLETED = auto()  # All targets done
 
 
+def trimmed_mean(values: np.ndarray, proportion: float) -> np.ndarray:
+    """
+    Compute the trimmed mean of each column.
+
+    Uses np.partition (O(N)) rather than a full sort.
+
+    Args:
+        values: Array of shape (N, K)
+        proportion: Proportion to trim from each end (0-0.5)
+
+    Returns:
+        Array of shape (K,) with per-column trimmed means
+    """
+    n = values.shape[0]
+    lo = int(proportion * n)
+    hi = n - lo
+
+    if lo >= hi:
+        raise ValueError("Trim proportion too large for sample count")
+
+    partitioned = np.partition(values, (lo, hi - 1), axis=0)
+    return partitioned[lo:hi].mean(axis=0, dtype=np.float64)
+
+
 @dataclass
 class CalibrationTarget:
     """Single calibration target information."""
@@ -34,11 +61,41 @@ class CalibrationTarget:
     index: int  # Target number (0-4)
     screen_x: float  # Screen position (pixels)
     screen_y: float  # Screen position (pixels)
-    samples: List[GazeVector]  # Collected gaze samples
+    capacity: int  # Maximum samples collected for this target
+
+    # Preallocated (capacity, 2) float32 buffer of gaze (x, y) samples
+    _buffer: np.ndarray = field(init=False, repr=False)
+    _count: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        """Allocate the sample buffer."""
+        self._buffer = np.empty((self.capacity, 2), dtype=np.float32)
+
+    def add_sample(self, gaze: GazeVector) -> bool:
+        """
+        Add a gaze sample for this target.
 
-    def add_sample(self, gaze: GazeVector):
-        """Add a gaze sample for this target."""
-        self.samples.append(gaze)
+        Returns:
+            True if stored, False if the buffer is full
+        """
+        if self._count >= self.capacity:
+            return False
+
+        row = self._buffer[self._count]
+        row[0] = gaze.x
+        row[1] = gaze.y
+        self._count += 1
+        return True
+
+    @property
+    def samples(self) -> np.ndarray:
+        """Collected samples as an (N, 2) array view."""
+        return self._buffer[:self._count]
+
+    @property
+    def sample_count(self) -> int:
+        """Number of collected samples."""
+        return self._count
 
     def compute_average(self, trim_percent: float = 0.1) -> Optional[Tuple[float, float]]:
         """
@@ -52,18 +109,13 @@ class CalibrationTarget:
         Returns:
             (avg_gaze_x, avg_gaze_y) or None if insufficient samples
         """
-        if len(self.samples) < 10:
+        if self._count < 10:
             return None
 
-        # Extract x and y components
-        gaze_x = np.array([s.x for s in self.samples])
-        gaze_y = np.array([s.y for s in self.samples])
+        # Trimmed mean (remove outliers), both axes at once
+        avg_x, avg_y = trimmed_mean(self.samples, trim_percent)
 
-        # Trimmed mean (remove outliers)
-        avg_x = float(stats.trim_mean(gaze_x, trim_percent))
-        avg_y = float(stats.trim_mean(gaze_y, trim_percent))
-
-        return (avg_x, avg_y)
+        return (float(avg_x), float(avg_y))
 
 
 class Calibrator:
@@ -101,9 +153,20 @@ class Calibrator:
         self._current_target_index = 0
         self._targets: List[CalibrationTarget] = []
 
+        # Target receiving samples (None before start and after the last
+        # target), kept so add_sample needs no list index
+        self._current_target: Optional[CalibrationTarget] = None
+        self._samples_per_point = 0
+
+        # (N, 2) target positions in pixels, set by start()
+        self._targets_xy = np.empty((0, 2), dtype=np.float64)
+
         # Calibration result
         self._calibration_data: Optional[CalibrationData] = None
 
+        # Change listener (target, sample count or state changed)
+        self._listener: Optional[Callable[[], None]] = None
+
         logger.info(f"Calibrator initialized for {screen_width}x{screen_height}")
 
     def start(self):
@@ -111,21 +174,29 @@ class Calibrator:
         self._state = CalibrationState.IDLE
         self._current_target_index = 0
         self._targets = []
+        self._current_target = None
+        self._samples_per_point = self._config.samples_per_point
 
-        # Create calibration targets from config
-        for i, (norm_x, norm_y) in enumerate(self._config.target_positions):
-            screen_x = norm_x * self._screen_width
-            screen_y = norm_y * self._screen_height
+        # Scale normalized target positions to pixels in one step
+        self._targets_xy = np.asarray(
+            self._config.target_positions, dtype=np.float64
+        ).reshape(-1, 2) * (self._screen_width, self._screen_height)
 
+        # Create calibration targets from config
+        for i, (screen_x, screen_y) in enumerate(self._targets_xy.tolist()):
             target = CalibrationTarget(
                 index=i,
                 screen_x=screen_x,
                 screen_y=screen_y,
-                samples=[],
+                capacity=self._samples_per_point,
             )
             self._targets.append(target)
 
+        if self._targets:
+            self._current_target = self._targets[0]
+
         logger.info(f"Calibration started: {len(self._targets)} targets")
+        self._notify()
 
     def add_sample(self, gaze: GazeVector) -> bool:
         """
@@ -140,20 +211,23 @@ class Calibrator:
         if self._state != CalibrationState.COLLECTING:
             return False
 
-        current_target = self._targets[self._current_target_index]
+        current_target = self._current_target
         current_target.add_sample(gaze)
 
-        # Check if we have enough samples
-        if len(current_target.samples) >= self._config.samples_per_point:
+        # Check if we have enough samples (the target's capacity is
+        # samples_per_point, so its count stops there)
+        if current_target.sample_count == self._samples_per_point:
             self._complete_current_target()
 
+        self._notify()
         return True
 
     def _complete_current_target(self):
         """Complete current target and move to next."""
         logger.info(
-            f"Target {self._current_target_index} completed: "
-            f"{len(self._targets[self._current_target_index].samples)} samples"
+            "Target %d completed: %d samples",
+            self._current_target_index,
+            self._current_target.sample_count,
         )
 
         # Move to next target
@@ -161,9 +235,11 @@ class Calibrator:
 
         if self._current_target_index >= len(self._targets):
             # All targets completed
+            self._current_target = None
             self._finalize_calibration()
         else:
             # Back to countdown for next target
+            self._current_target = self._targets[self._current_target_index]
             self._state = CalibrationState.COUNTDOWN
 
     def _finalize_calibration(self):
@@ -184,7 +260,7 @@ class Calibrator:
                     screen_y=target.screen_y,
                     gaze_x=gaze_x,
                     gaze_y=gaze_y,
-                    sample_count=len(target.samples),
+                    sample_count=target.sample_count,
                 )
                 points.append(point)
 
@@ -208,13 +284,27 @@ class Calibrator:
 
     def get_current_target(self) -> Optional[CalibrationTarget]:
         """Get current calibration target."""
-        if 0 <= self._current_target_index < len(self._targets):
-            return self._targets[self._current_target_index]
-        return None
+        return self._current_target
 
     def set_state(self, state: CalibrationState):
         """Set calibration state (called by controller)."""
         self._state = state
+        self._notify()
+
+    def set_listener(self, listener: Optional[Callable[[], None]]):
+        """
+        Register a callback invoked when the target, sample count or state changes.
+
+        Args:
+            listener: Callback taking no arguments, or None to remove.
+                Called on the thread that drives the calibrator.
+        """
+        self._listener = listener
+
+    def _notify(self):
+        """Invoke the change listener, if any."""
+        if self._listener is not None:
+            self._listener()
 
     @property
     def state(self) -> CalibrationState:
@@ -226,6 +316,11 @@ class Calibrator:
         """Get calibration result."""
         return self._calibration_data
 
+    @property
+    def target_positions(self) -> np.ndarray:
+        """Get target positions in pixels as an (N, 2) array (empty before start)."""
+        return self._targets_xy
+
     @property
     def progress(self) -> Tuple[int, int]:
         """Get progress (current_target, total_targets)."""
@@ -274,28 +369,77 @@ class GazeMapper:
         gaze_array = self._calibration.get_gaze_array()  # (N, 2)
         screen_array = self._calibration.get_screen_array()  # (N, 2)
 
-        # Find gaze bounds
-        self._gaze_min_x = np.min(gaze_array[:, 0])
-        self._gaze_max_x = np.max(gaze_array[:, 0])
-        self._gaze_min_y = np.min(gaze_array[:, 1])
-        self._gaze_max_y = np.max(gaze_array[:, 1])
+        # Gaze bounds and the points that reach them, one reduction per
+        # statistic across both columns
+        self._gaze_min_x, self._gaze_min_y = gaze_array.min(axis=0)
+        self._gaze_max_x, self._gaze_max_y = gaze_array.max(axis=0)
+        idx_min_x, idx_min_y = gaze_array.argmin(axis=0)
+        idx_max_x, idx_max_y = gaze_array.argmax(axis=0)
 
         # Find corresponding screen bounds
-        idx_min_x = np.argmin(gaze_array[:, 0])
-        idx_max_x = np.argmax(gaze_array[:, 0])
-        idx_min_y = np.argmin(gaze_array[:, 1])
-        idx_max_y = np.argmax(gaze_array[:, 1])
-
         self._screen_at_min_x = screen_array[idx_min_x, 0]
         self._screen_at_max_x = screen_array[idx_max_x, 0]
         self._screen_at_min_y = screen_array[idx_min_y, 1]
         self._screen_at_max_y = screen_array[idx_max_y, 1]
 
+        # Precompute per-axis linear coefficients: screen = scale * gaze + offset
+        # (calibration is immutable, so per-frame work is one multiply-add per axis)
+        self._scale_x, self._offset_x = self._axis_coefficients(
+            self._gaze_min_x, self._gaze_max_x,
+            self._screen_at_min_x, self._screen_at_max_x,
+            self._screen_width / 2,
+        )
+        self._scale_y, self._offset_y = self._axis_coefficients(
+            self._gaze_min_y, self._gaze_max_y,
+            self._screen_at_min_y, self._screen_at_max_y,
+            self._screen_height / 2,
+        )
+
+        # The same coefficients as (2,) float32 arrays for batch mapping:
+        # the diagonal affine transform screen = gaze * scale + offset
+        # (float32 resolves well under a pixel across any screen width)
+        self._scale_xy = np.array((self._scale_x, self._scale_y), dtype=np.float32)
+        self._offset_xy = np.array((self._offset_x, self._offset_y), dtype=np.float32)
+
+        # Clamp limits (screen bounds)
+        self._max_x = float(self._screen_width - 1)
+        self._max_y = float(self._screen_height - 1)
+        self._upper_xy = np.array((self._max_x, self._max_y), dtype=np.float32)
+
         logger.debug(
-            f"Gaze bounds: x=[{self._gaze_min_x:.2f}, {self._gaze_max_x:.2f}], "
-            f"y=[{self._gaze_min_y:.2f}, {self._gaze_max_y:.2f}]"
+            "Gaze bounds: x=[%.2f, %.2f], y=[%.2f, %.2f]",
+            self._gaze_min_x, self._gaze_max_x,
+            self._gaze_min_y, self._gaze_max_y,
         )
 
+    @staticmethod
+    def _axis_coefficients(
+        gaze_min: float,
+        gaze_max: float,
+        screen_at_min: float,
+        screen_at_max: float,
+        fallback: float,
+    ) -> Tuple[float, float]:
+        """
+        Compute linear interpolation coefficients for one axis.
+
+        Args:
+            gaze_min: Minimum calibrated gaze value
+            gaze_max: Maximum calibrated gaze value
+            screen_at_min: Screen coordinate at minimum gaze
+            screen_at_max: Screen coordinate at maximum gaze
+            fallback: Screen coordinate used when the gaze range is degenerate
+
+        Returns:
+            (scale, offset) such that screen = scale * gaze + offset
+        """
+        if gaze_max == gaze_min:
+            return (0.0, float(fallback))
+
+        scale = float((screen_at_max - screen_at_min) / (gaze_max - gaze_min))
+        offset = float(screen_at_min) - float(gaze_min) * scale
+        return (scale, offset)
+
     def map_gaze_to_screen(self, gaze: GazeVector) -> Tuple[float, float]:
         """
         Map gaze vector to screen coordinates.
@@ -306,29 +450,32 @@ class GazeMapper:
         Returns:
             (screen_x, screen_y) in pixels
         """
-        # Linear interpolation
-        if self._gaze_max_x != self._gaze_min_x:
-            t_x = (gaze.x - self._gaze_min_x) / (self._gaze_max_x - self._gaze_min_x)
-            screen_x = self._screen_at_min_x + t_x * (
-                self._screen_at_max_x - self._screen_at_min_x
-            )
-        else:
-            screen_x = self._screen_width / 2
-
-        if self._gaze_max_y != self._gaze_min_y:
-            t_y = (gaze.y - self._gaze_min_y) / (self._gaze_max_y - self._gaze_min_y)
-            screen_y = self._screen_at_min_y + t_y * (
-                self._screen_at_max_y - self._screen_at_min_y
-            )
-        else:
-            screen_y = self._screen_height / 2
+        # Linear interpolation (coefficients precomputed at init)
+        screen_x = self._scale_x * gaze.x + self._offset_x
+        screen_y = self._scale_y * gaze.y + self._offset_y
 
         # Clamp to screen bounds
-        screen_x = np.clip(screen_x, 0, self._screen_width - 1)
-        screen_y = np.clip(screen_y, 0, self._screen_height - 1)
+        screen_x = min(max(screen_x, 0.0), self._max_x)
+        screen_y = min(max(screen_y, 0.0), self._max_y)
 
         return (float(screen_x), float(screen_y))
 
+    def map_gaze_to_screen_batch(self, gaze_xy: np.ndarray) -> np.ndarray:
+        """
+        Map many gaze vectors to screen coordinates at once.
+
+        Same mapping and clamping as map_gaze_to_screen, vectorized.
+
+        Args:
+            gaze_xy: Array of shape (N, 2) with gaze (x, y) rows
+
+        Returns:
+            Array of shape (N, 2) with screen (x, y) in pixels (float32)
+        """
+        screen = np.asarray(gaze_xy, dtype=np.float32) * self._scale_xy
+        screen += self._offset_xy
+        return np.clip(screen, 0.0, self._upper_xy, out=screen)
+
     @property
     def screen_size(self) -> Tuple[int, int]:
         """Get calibration screen size."""
@@ -4,16 +4,26 @@ Camera capture module with error handling.
 Privacy: All frames processed in-memory only, never saved to disk.
 """
 
+import time
+
 import cv2
 import numpy as np
 from typing import Optional, Tuple, List
 from dataclasses import dataclass
 
 from src.core.config import CameraConfig
+from src.utils.image import fit_within
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# A grab() that returns faster than this came from the driver's queue
+# rather than waiting for the sensor (a 60 fps frame takes ~16 ms)
+_STALE_GRAB_SECONDS = 0.002
+
+# Upper bound on frames dropped per read_latest() call
+_MAX_DROPPED_FRAMES = 8
+
 
 def list_available_cameras(max_test: int = 5) -> List[int]:
     """
@@ -36,11 +46,16 @@ def list_available_cameras(max_test: int = 5) -> List[int]:
     return available
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraFrame:
-    """Represents a captured camera frame with metadata."""
+    """
+    Represents a captured camera frame with metadata.
+
+    Camera reuses its image buffer: the array is only valid until the
+    next read, so copy it if it must be kept.
+    """
 
-    image: np.ndarray  # RGB format (H, W, 3)
+    image: np.ndarray  # RGB format (H, W, 3), at the camera's output size
     timestamp: float
     frame_number: int
 
@@ -58,21 +73,31 @@ class Camera:
     Privacy: Frames are never saved to disk. All processing in-memory only.
     """
 
-    def __init__(self, config: CameraConfig):
+    def __init__(self, config: CameraConfig, output_size: Optional[Tuple[int, int]] = None):
         """
         Initialize camera.
 
         Args:
             config: Camera configuration
+            output_size: (width, height) bound to deliver frames within, or
+                None for the capture size. Larger captures are shrunk (aspect
+                ratio kept) before color conversion, so only the small image
+                is converted.
 
         Raises:
             CameraError: If camera cannot be initialized
         """
         self._config = config
+        self._output_size = output_size
         self._capture: Optional[cv2.VideoCapture] = None
         self._is_open = False
         self._frame_count = 0
 
+        # Reused capture/conversion buffers (allocated on first frame)
+        self._frame_bgr: Optional[np.ndarray] = None
+        self._frame_small: Optional[np.ndarray] = None
+        self._frame_rgb: Optional[np.ndarray] = None
+
         logger.info(f"Initializing camera {config.camera_index}")
 
     def open(self) -> bool:
@@ -111,8 +136,9 @@ class Camera:
             self._capture.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25)
 
             # Warm up camera (skip first few frames which may be black/corrupted)
+            # grab() discards without decoding, unlike read()
             for _ in range(self._config.warmup_frames):
-                self._capture.read()
+                self._capture.grab()
 
             self._is_open = True
             self._frame_count = 0
@@ -136,7 +162,7 @@ class Camera:
 
     def read_frame(self) -> Optional[CameraFrame]:
         """
-        Read a frame from the camera.
+        Read the next frame from the camera.
 
         Returns:
             CameraFrame if successful, None if read failed
@@ -150,27 +176,101 @@ class Camera:
             return None
 
         try:
-            ret, frame = self._capture.read()
+            # read() and cvtColor() release the GIL inside OpenCV, so the
+            # UI thread keeps running while the worker waits on the camera
+            ret, frame = self._capture.read(self._frame_bgr)
 
             if not ret or frame is None:
                 logger.warning("Failed to read frame from camera")
                 return None
 
-            # Convert BGR (OpenCV default) to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            self._frame_bgr = frame
 
-            self._frame_count += 1
+            return self._to_camera_frame(frame)
 
-            return CameraFrame(
-                image=frame_rgb,
-                timestamp=cv2.getTickCount() / cv2.getTickFrequency(),
-                frame_number=self._frame_count,
-            )
+        except Exception as e:
+            logger.error(f"Error reading camera frame: {e}")
+            return None
+
+    def read_latest(self) -> Optional[CameraFrame]:
+        """
+        Read the most recent frame, dropping any the driver has buffered.
+
+        grab() returns immediately while stale frames are queued and blocks
+        once the queue is empty, so grabbing until one call blocks leaves the
+        newest frame to decode. Only that frame is retrieved (decoded).
+
+        Returns:
+            CameraFrame if successful, None if read failed
+        """
+        if not self._is_open or self._capture is None:
+            logger.warning("Attempted to read from closed camera")
+            return None
+
+        try:
+            dropped = 0
+            while True:
+                start = time.perf_counter()
+                if not self._capture.grab():
+                    logger.warning("Failed to grab frame from camera")
+                    return None
+                if (time.perf_counter() - start < _STALE_GRAB_SECONDS
+                        and dropped < _MAX_DROPPED_FRAMES):
+                    # Returned without waiting: a buffered frame, try for newer
+                    dropped += 1
+                    continue
+                break
+
+            ret, frame = self._capture.retrieve(self._frame_bgr)
+            if not ret or frame is None:
+                logger.warning("Failed to retrieve frame from camera")
+                return None
+
+            self._frame_bgr = frame
+
+            if dropped:
+                logger.debug("Dropped %d stale camera frames", dropped)
+
+            return self._to_camera_frame(frame)
 
         except Exception as e:
             logger.error(f"Error reading camera frame: {e}")
             return None
 
+    def _to_camera_frame(self, frame: np.ndarray) -> CameraFrame:
+        """Convert a BGR capture to an RGB CameraFrame."""
+        if self._output_size is not None:
+            frame = self._shrink(frame)
+
+        if self._frame_rgb is None or self._frame_rgb.shape != frame.shape:
+            self._frame_rgb = np.empty_like(frame)
+
+        # Convert BGR (OpenCV default) to RGB into the reused buffer
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._frame_rgb)
+
+        self._frame_count += 1
+
+        return CameraFrame(
+            image=frame_rgb,
+            timestamp=time.perf_counter(),
+            frame_number=self._frame_count,
+        )
+
+    def _shrink(self, frame: np.ndarray) -> np.ndarray:
+        """Shrink a BGR capture to fit output_size, keeping its aspect ratio."""
+        frame_height, frame_width = frame.shape[:2]
+        width, height = fit_within(frame_width, frame_height, self._output_size)
+        if width == frame_width and height == frame_height:
+            return frame
+
+        shape = (height, width, frame.shape[2])
+        if self._frame_small is None or self._frame_small.shape != shape:
+            self._frame_small = np.empty(shape, dtype=frame.dtype)
+
+        return cv2.resize(
+            frame, (width, height), dst=self._frame_small, interpolation=cv2.INTER_AREA
+        )
+
     def get_frame_size(self) -> Tuple[int, int]:
         """
         Get current frame dimensions.
@@ -196,6 +296,10 @@ class Camera:
             self._capture.release()
             self._capture = None
 
+        self._frame_bgr = None
+        self._frame_small = None
+        self._frame_rgb = None
+
         self._is_open = False
         logger.info("Camera closed")
 
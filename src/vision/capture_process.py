@@ -0,0 +1,325 @@
+"""
+Camera capture in a separate process.
+
+A producer process owns the cv2.VideoCapture and writes RGB frames into a
+shared-memory ring buffer; the consumer (the processing worker) reads the
+latest slot by sequence number. Capture is then unaffected by GIL contention
+or pauses in the UI process, and the consumer never sees a stale queued frame.
+
+Privacy: Frames live only in shared memory, never on disk.
+"""
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import threading
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.core.config import CameraConfig
+from src.vision.camera import CameraError, CameraFrame
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ring buffer slots (consumer copies a slot long before the producer laps it)
+_NUM_SLOTS = 4
+
+# Seconds to wait for the producer to open the camera
+_OPEN_TIMEOUT = 10.0
+
+# Seconds read_frame() waits for a new frame before giving up
+_READ_TIMEOUT = 1.0
+
+
+def _capture_loop(config: CameraConfig, conn, counter, frame_ready, stop_event):
+    """
+    Producer process body.
+
+    Opens the camera, reports the shared-memory name and frame shape over
+    conn (or an error string), then writes frames until stop_event is set.
+    """
+    import cv2
+
+    capture = cv2.VideoCapture(config.camera_index, cv2.CAP_DSHOW)
+    if not capture.isOpened():
+        conn.send(f"Failed to open camera {config.camera_index}")
+        conn.close()
+        return
+
+    capture.set(cv2.CAP_PROP_FRAME_WIDTH, config.frame_width)
+    capture.set(cv2.CAP_PROP_FRAME_HEIGHT, config.frame_height)
+    capture.set(cv2.CAP_PROP_FPS, config.target_fps)
+    capture.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25)
+
+    for _ in range(config.warmup_frames):
+        capture.grab()
+
+    ret, frame = capture.read()
+    if not ret or frame is None:
+        capture.release()
+        conn.send("Failed to read initial frame from camera")
+        conn.close()
+        return
+
+    shape = frame.shape
+    shm = shared_memory.SharedMemory(create=True, size=_NUM_SLOTS * frame.nbytes)
+    try:
+        slots = np.ndarray((_NUM_SLOTS, *shape), dtype=np.uint8, buffer=shm.buf)
+        conn.send((shm.name, shape))
+        conn.close()
+
+        seq = 0
+        while not stop_event.is_set():
+            ret, frame = capture.read()
+            if not ret or frame is None or frame.shape != shape:
+                time.sleep(0.01)
+                continue
+
+            # Convert straight into the next slot, then publish it
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=slots[seq % _NUM_SLOTS])
+            seq += 1
+            counter.value = seq
+            frame_ready.set()
+
+        del slots
+    finally:
+        capture.release()
+        shm.close()
+        shm.unlink()
+
+
+class CaptureProcess:
+    """
+    Camera backed by a producer subprocess and a shared-memory ring buffer.
+
+    Drop-in replacement for Camera (open, read_frame, close, is_open).
+    """
+
+    def __init__(self, config: CameraConfig):
+        """
+        Initialize capture process wrapper.
+
+        Args:
+            config: Camera configuration
+        """
+        self._config = config
+        self._process: Optional[mp.Process] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._slots: Optional[np.ndarray] = None
+        self._frame: Optional[np.ndarray] = None
+        self._counter = None
+        self._frame_ready = None
+        self._stop_event = None
+        self._last_seq = 0
+        self._frame_count = 0
+        self._dropped_frames = 0
+        self._is_open = False
+
+        # Serializes the slot copy in read_frame() against close(), which
+        # may run on another thread while a read is waiting for a frame
+        self._lock = threading.Lock()
+
+        logger.info(f"Initializing capture process for camera {config.camera_index}")
+
+    def open(self) -> bool:
+        """
+        Start the producer process and attach to its ring buffer.
+
+        Returns:
+            True if successful
+
+        Raises:
+            CameraError: If the camera cannot be opened
+        """
+        if self._is_open:
+            logger.warning("Camera already open")
+            return True
+
+        ctx = mp.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        self._counter = ctx.Value("Q", 0, lock=False)
+        self._frame_ready = ctx.Event()
+        self._stop_event = ctx.Event()
+
+        self._process = ctx.Process(
+            target=_capture_loop,
+            args=(self._config, child_conn, self._counter, self._frame_ready, self._stop_event),
+            name="CameraCapture",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        try:
+            if not parent_conn.poll(_OPEN_TIMEOUT):
+                raise CameraError("Timed out waiting for camera capture process")
+            message = parent_conn.recv()
+        except (EOFError, OSError) as e:
+            self._stop_process()
+            raise CameraError(f"Camera capture process failed: {e}") from e
+        finally:
+            parent_conn.close()
+
+        if isinstance(message, str):
+            self._stop_process()
+            error_msg = f"Camera initialization failed: {message}"
+            logger.error(error_msg)
+            raise CameraError(error_msg)
+
+        name, shape = message
+        self._shm = shared_memory.SharedMemory(name=name)
+        self._slots = np.ndarray((_NUM_SLOTS, *shape), dtype=np.uint8, buffer=self._shm.buf)
+        self._frame = np.empty(shape, dtype=np.uint8)
+        self._last_seq = 0
+        self._frame_count = 0
+        self._dropped_frames = 0
+        self._is_open = True
+
+        logger.info(f"Capture process started: {shape[1]}x{shape[0]}")
+        return True
+
+    def read_frame(self) -> Optional[CameraFrame]:
+        """
+        Read the latest frame published by the producer.
+
+        Returns:
+            CameraFrame if a new frame arrived, None on timeout or if closed
+
+        Note:
+            Returned frame is an RGB copy of the slot, so the producer can
+            keep writing while the caller uses it. As with Camera, the copy
+            goes into a reused buffer that is only valid until the next read.
+        """
+        if not self._is_open:
+            logger.warning("Attempted to read from closed camera")
+            return None
+
+        seq = self._counter.value
+        if seq == self._last_seq:
+            self._frame_ready.clear()
+            # Re-check after clearing so a frame published in between
+            # is not missed
+            seq = self._counter.value
+            if seq == self._last_seq:
+                if not self._frame_ready.wait(_READ_TIMEOUT):
+                    return None
+                seq = self._counter.value
+
+        with self._lock:
+            # Closed while waiting for the frame
+            if not self._is_open:
+                return None
+
+            try:
+                seq = self._copy_slot(seq)
+            except Exception as e:
+                logger.error(f"Error reading camera frame: {e}")
+                return None
+
+            # Frames published since the last read that were overwritten unseen
+            skipped = seq - self._last_seq - 1
+            if skipped:
+                self._dropped_frames += skipped
+
+            self._last_seq = seq
+            self._frame_count += 1
+
+            return CameraFrame(
+                image=self._frame,
+                timestamp=time.perf_counter(),
+                frame_number=self._frame_count,
+            )
+
+    def _copy_slot(self, seq: int) -> int:
+        """
+        Copy frame seq out of the ring into the read buffer.
+
+        While the counter reads c the producer is writing slot c % _NUM_SLOTS,
+        so if it reached seq - 1 + _NUM_SLOTS during the copy, the slot may
+        have been overwritten mid-copy. The copy is then retried with the
+        newest frame.
+
+        Args:
+            seq: Sequence number of the frame to copy (1-based)
+
+        Returns:
+            Sequence number of the frame actually copied
+        """
+        while True:
+            np.copyto(self._frame, self._slots[(seq - 1) % _NUM_SLOTS])
+            latest = self._counter.value
+            if latest - seq < _NUM_SLOTS - 1:
+                return seq
+            seq = latest
+
+    # The ring buffer always holds the newest frame
+    read_latest = read_frame
+
+    def get_frame_size(self) -> Tuple[int, int]:
+        """
+        Get current frame dimensions.
+
+        Returns:
+            (width, height) tuple
+        """
+        if self._slots is None:
+            return (self._config.frame_width, self._config.frame_height)
+        return (self._slots.shape[2], self._slots.shape[1])
+
+    def _stop_process(self):
+        """Signal the producer to exit and wait for it."""
+        if self._process is None:
+            return
+
+        self._stop_event.set()
+        self._process.join(timeout=2.0)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._process = None
+
+    def close(self):
+        """
+        Stop the producer and release shared memory.
+
+        Safe to call multiple times.
+        """
+        if self._is_open and self._frame_count:
+            logger.info(
+                "Capture process read %d frames, dropped %d stale",
+                self._frame_count,
+                self._dropped_frames,
+            )
+
+        with self._lock:
+            self._is_open = False
+            self._slots = None
+            self._frame = None
+            if self._shm is not None:
+                self._shm.close()
+                self._shm = None
+
+        if self._process is not None:
+            self._stop_process()
+            logger.info("Camera closed")
+
+    @property
+    def is_open(self) -> bool:
+        """Check if camera is open."""
+        return self._is_open
+
+    @property
+    def frame_count(self) -> int:
+        """Get number of frames read."""
+        return self._frame_count
+
+    @property
+    def dropped_frames(self) -> int:
+        """Get number of captured frames superseded before they were read."""
+        return self._dropped_frames
+
+    def __del__(self):
+        """Cleanup on deletion."""
+        self.close()
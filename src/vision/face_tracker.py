@@ -5,12 +5,17 @@ Privacy: No facial recognition, no biometric templates stored.
 Only extracts geometric landmarks for gaze estimation.
 """
 
+from itertools import chain
+from operator import attrgetter
+import threading
+
 import cv2
 import numpy as np
 import mediapipe as mp
-from typing import Optional, List, Tuple
+from typing import Optional, Tuple
 from dataclasses import dataclass
 
+from src.utils.image import fit_within
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,8 +32,16 @@ LEFT_IRIS_INDICES = [468, 469, 470, 471, 472]  # Iris center and outline
 RIGHT_EYE_INDICES = [362, 263, 387, 386, 385, 373, 374, 380]
 RIGHT_IRIS_INDICES = [473, 474, 475, 476, 477]  # Iris center and outline
 
+# Contour indices as intp arrays, so per-frame indexing does not convert
+# a Python list each time
+_LEFT_EYE_IDX = np.asarray(LEFT_EYE_INDICES, dtype=np.intp)
+_RIGHT_EYE_IDX = np.asarray(RIGHT_EYE_INDICES, dtype=np.intp)
+
+# Reads (x, y) from a landmark message in one C-level call
+_LANDMARK_XY = attrgetter("x", "y")
+
 
-@dataclass
+@dataclass(slots=True)
 class EyeLandmarks:
     """Eye landmarks and iris position."""
 
@@ -45,7 +58,7 @@ class EyeLandmarks:
     contour: np.ndarray  # Shape: (N, 2)
 
 
-@dataclass
+@dataclass(slots=True)
 class FaceLandmarks:
     """Face detection result with eye landmarks."""
 
@@ -59,7 +72,8 @@ class FaceLandmarks:
     # Face bounding box (normalized 0-1)
     bbox: Tuple[float, float, float, float]  # (x_min, y_min, x_max, y_max)
 
-    # All face landmarks (for debug visualization)
+    # All face landmarks (for debug visualization; None unless the
+    # tracker was created with include_all_landmarks=True)
     all_landmarks: Optional[np.ndarray] = None  # Shape: (478, 2)
 
 
@@ -76,6 +90,8 @@ class FaceTracker:
         min_detection_confidence: float = 0.5,
         min_tracking_confidence: float = 0.5,
         max_num_faces: int = 1,
+        include_all_landmarks: bool = False,
+        inference_size: Optional[Tuple[int, int]] = None,
     ):
         """
         Initialize face tracker.
@@ -84,10 +100,21 @@ class FaceTracker:
             min_detection_confidence: Minimum confidence for face detection
             min_tracking_confidence: Minimum confidence for landmark tracking
             max_num_faces: Maximum number of faces to detect (1 for gaze tracking)
+            include_all_landmarks: Attach the full landmark array to results
+                (only needed for debug visualization)
+            inference_size: (width, height) bound to downscale larger frames
+                to before inference (aspect ratio kept), or None to use
+                frames as captured. Landmarks are normalized, so no mapping
+                back is needed.
         """
         self._min_detection_confidence = min_detection_confidence
         self._min_tracking_confidence = min_tracking_confidence
         self._max_num_faces = max_num_faces
+        self._include_all_landmarks = include_all_landmarks
+        self._inference_size = inference_size
+
+        # Reused downscale target (allocated on first frame)
+        self._small_frame: Optional[np.ndarray] = None
 
         # Initialize MediaPipe Face Mesh
         # refine_landmarks=True enables iris tracking
@@ -99,8 +126,45 @@ class FaceTracker:
             min_tracking_confidence=min_tracking_confidence,
         )
 
+        # Background warm-up run (see start_warmup)
+        self._warmup_thread: Optional[threading.Thread] = None
+
         logger.info("FaceTracker initialized with MediaPipe Face Mesh")
 
+    def start_warmup(self, width: int, height: int):
+        """
+        Run one blank frame through Face Mesh in the background.
+
+        The first inference initializes the graph and takes hundreds of
+        milliseconds; doing it while the camera opens keeps that stall
+        off the first real frame. process_frame() waits for it to finish.
+
+        Args:
+            width: Expected frame width
+            height: Expected frame height
+        """
+        if self._warmup_thread is not None:
+            return
+
+        if self._inference_size is not None:
+            width, height = fit_within(width, height, self._inference_size)
+
+        blank = np.zeros((height, width, 3), dtype=np.uint8)
+        blank.flags.writeable = False
+        self._warmup_thread = threading.Thread(
+            target=self._face_mesh.process,
+            args=(blank,),
+            name="FaceMeshWarmup",
+            daemon=True,
+        )
+        self._warmup_thread.start()
+
+    def _finish_warmup(self):
+        """Wait for a pending warm-up run."""
+        if self._warmup_thread is not None:
+            self._warmup_thread.join()
+            self._warmup_thread = None
+
     def process_frame(self, frame: np.ndarray) -> Optional[FaceLandmarks]:
         """
         Process a frame and extract face/eye landmarks.
@@ -116,10 +180,27 @@ class FaceTracker:
         if frame is None or frame.size == 0:
             return None
 
+        if self._warmup_thread is not None:
+            self._finish_warmup()
+
         try:
+            if self._inference_size is not None:
+                frame = self._downscale(frame)
+
             # Process frame with MediaPipe
-            # Input must be RGB (we convert in camera.py)
-            results = self._face_mesh.process(frame)
+            # Input must be RGB (we convert in camera.py). A read-only
+            # array is passed to the graph by reference instead of being
+            # copied; the graph runs in C++ without holding the GIL.
+            # Restore the caller's flag afterwards (Camera reuses the
+            # buffer; a buffer that is read-only by nature stays so).
+            was_writeable = frame.flags.writeable
+            if was_writeable:
+                frame.flags.writeable = False
+            try:
+                results = self._face_mesh.process(frame)
+            finally:
+                if was_writeable:
+                    frame.flags.writeable = True
 
             if not results.multi_face_landmarks:
                 return None
@@ -132,8 +213,8 @@ class FaceTracker:
             landmarks = self._extract_landmarks(face_landmarks, width, height)
 
             # Extract eye-specific landmarks
-            left_eye = self._extract_eye_landmarks(landmarks, LEFT_EYE_INDICES, LEFT_IRIS_INDICES)
-            right_eye = self._extract_eye_landmarks(landmarks, RIGHT_EYE_INDICES, RIGHT_IRIS_INDICES)
+            left_eye = self._extract_eye_landmarks(landmarks, _LEFT_EYE_IDX, LEFT_IRIS_INDICES[0])
+            right_eye = self._extract_eye_landmarks(landmarks, _RIGHT_EYE_IDX, RIGHT_IRIS_INDICES[0])
 
             # Calculate bounding box
             bbox = self._calculate_bbox(landmarks)
@@ -147,13 +228,39 @@ class FaceTracker:
                 left_eye=left_eye,
                 right_eye=right_eye,
                 bbox=bbox,
-                all_landmarks=landmarks,
+                all_landmarks=landmarks if self._include_all_landmarks else None,
             )
 
         except Exception as e:
-            logger.debug(f"Error processing frame: {e}")
+            logger.debug("Error processing frame: %s", e)
             return None
 
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Shrink a frame to fit the inference size, keeping its aspect ratio.
+
+        Args:
+            frame: RGB image (H, W, 3)
+
+        Returns:
+            Downscaled frame (a reused buffer), or the frame unchanged if
+            it already fits
+        """
+        frame_height, frame_width = frame.shape[:2]
+        width, height = fit_within(frame_width, frame_height, self._inference_size)
+        if width == frame_width and height == frame_height:
+            return frame
+
+        shape = (height, width, frame.shape[2])
+        if self._small_frame is None or self._small_frame.shape != shape:
+            self._small_frame = np.empty(shape, dtype=frame.dtype)
+
+        # INTER_AREA averages source pixels, which keeps the iris edges
+        # stable when shrinking
+        return cv2.resize(
+            frame, (width, height), dst=self._small_frame, interpolation=cv2.INTER_AREA
+        )
+
     def _extract_landmarks(
         self, face_landmarks, width: int, height: int
     ) -> np.ndarray:
@@ -168,44 +275,51 @@ class FaceTracker:
         Returns:
             Numpy array of shape (478, 2) with normalized coords (0-1)
         """
-        landmarks = np.array(
-            [[lm.x, lm.y] for lm in face_landmarks.landmark],
+        # Stream x, y pairs straight into one exactly-sized array, with no
+        # intermediate list of per-landmark lists
+        points = face_landmarks.landmark
+        n = len(points)
+        return np.fromiter(
+            chain.from_iterable(map(_LANDMARK_XY, points)),
             dtype=np.float32,
-        )
-        return landmarks
+            count=2 * n,
+        ).reshape(n, 2)
 
     def _extract_eye_landmarks(
         self,
         all_landmarks: np.ndarray,
-        eye_indices: List[int],
-        iris_indices: List[int],
+        eye_indices: np.ndarray,
+        iris_center_index: int,
     ) -> EyeLandmarks:
         """
         Extract eye-specific landmarks.
 
         Args:
             all_landmarks: All face landmarks (478, 2)
-            eye_indices: Indices for eye contour
-            iris_indices: Indices for iris
+            eye_indices: Indices for eye contour (intp array)
+            iris_center_index: Index of the iris center landmark
 
         Returns:
             EyeLandmarks with eye geometry
         """
         # Get eye contour points
-        eye_points = all_landmarks[eye_indices]
+        eye_points = np.take(all_landmarks, eye_indices, axis=0)
 
         # Estimate eye corners and top/bottom
         # Left corner: leftmost point
         # Right corner: rightmost point
         # Top: topmost point
         # Bottom: bottommost point
-        left_corner = eye_points[np.argmin(eye_points[:, 0])]
-        right_corner = eye_points[np.argmax(eye_points[:, 0])]
-        top = eye_points[np.argmin(eye_points[:, 1])]
-        bottom = eye_points[np.argmax(eye_points[:, 1])]
+        # (one argmin and one argmax over both columns)
+        left_idx, top_idx = eye_points.argmin(axis=0)
+        right_idx, bottom_idx = eye_points.argmax(axis=0)
+        left_corner = eye_points[left_idx]
+        right_corner = eye_points[right_idx]
+        top = eye_points[top_idx]
+        bottom = eye_points[bottom_idx]
 
-        # Iris center (first index is the center point)
-        iris_center = all_landmarks[iris_indices[0]]
+        # Iris center
+        iris_center = all_landmarks[iris_center_index]
 
         return EyeLandmarks(
             left_corner=left_corner,
@@ -245,7 +359,11 @@ class FaceTracker:
         """
         # Use inverse of landmark variance as confidence proxy
         # Stable landmarks = high confidence
-        variance = np.var(landmarks)
+        # Single pass in float64: var = E[x^2] - E[x]^2, with the sum of
+        # squares as one dot product (no centered temporary as in np.var)
+        flat = landmarks.ravel().astype(np.float64)
+        mean = flat.sum() / flat.size
+        variance = float(flat @ flat) / flat.size - mean * mean
 
         # Normalize to 0-1 range (empirical scaling)
         confidence = np.clip(1.0 - variance * 100, 0.0, 1.0)
@@ -254,6 +372,7 @@ class FaceTracker:
 
     def close(self):
         """Release MediaPipe resources."""
+        self._finish_warmup()
         if self._face_mesh:
             self._face_mesh.close()
             logger.info("FaceTracker closed")
@@ -6,16 +6,19 @@ through calibration.
 """
 
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 
-from src.vision.face_tracker import FaceLandmarks, EyeLandmarks
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    # Annotation-only: importing face_tracker at runtime pulls in MediaPipe
+    from src.vision.face_tracker import FaceLandmarks, EyeLandmarks
+
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GazeVector:
     """
     Gaze direction vector in normalized space.
@@ -23,6 +26,9 @@ class GazeVector:
     Coordinates are normalized relative to eye geometry:
     - x: horizontal gaze (-1 = left, 0 = center, +1 = right)
     - y: vertical gaze (-1 = up, 0 = center, +1 = down)
+
+    Slotted and frozen: the mapper reads .x/.y every frame and a vector
+    is never modified after estimation.
     """
 
     x: float  # Horizontal component
@@ -52,7 +58,7 @@ class GazeEstimator:
         self._last_gaze: Optional[GazeVector] = None
         logger.info("GazeEstimator initialized")
 
-    def estimate(self, face_landmarks: FaceLandmarks) -> Optional[GazeVector]:
+    def estimate(self, face_landmarks: "FaceLandmarks") -> Optional[GazeVector]:
         """
         Estimate gaze direction from face landmarks.
 
@@ -70,32 +76,27 @@ class GazeEstimator:
         if face_landmarks is None:
             return None
 
-        try:
-            # Estimate gaze from each eye
-            left_gaze = self._estimate_eye_gaze(face_landmarks.left_eye)
-            right_gaze = self._estimate_eye_gaze(face_landmarks.right_eye)
+        # Estimate gaze from each eye
+        left_gaze = self._estimate_eye_gaze(face_landmarks.left_eye)
+        right_gaze = self._estimate_eye_gaze(face_landmarks.right_eye)
 
-            if left_gaze is None or right_gaze is None:
-                return None
-
-            # Average both eyes for stability
-            # Weight by confidence if needed (currently equal weight)
-            gaze_x = (left_gaze[0] + right_gaze[0]) / 2.0
-            gaze_y = (left_gaze[1] + right_gaze[1]) / 2.0
+        if left_gaze is None or right_gaze is None:
+            return None
 
-            # Use face detection confidence
-            confidence = face_landmarks.confidence
+        # Average both eyes for stability
+        # Weight by confidence if needed (currently equal weight)
+        gaze_x = (left_gaze[0] + right_gaze[0]) / 2.0
+        gaze_y = (left_gaze[1] + right_gaze[1]) / 2.0
 
-            gaze = GazeVector(x=gaze_x, y=gaze_y, confidence=confidence)
-            self._last_gaze = gaze
+        # Use face detection confidence
+        confidence = face_landmarks.confidence
 
-            return gaze
+        gaze = GazeVector(x=gaze_x, y=gaze_y, confidence=confidence)
+        self._last_gaze = gaze
 
-        except Exception as e:
-            logger.debug(f"Error estimating gaze: {e}")
-            return self._last_gaze  # Return last valid gaze on error
+        return gaze
 
-    def _estimate_eye_gaze(self, eye: EyeLandmarks) -> Optional[np.ndarray]:
+    def _estimate_eye_gaze(self, eye: "EyeLandmarks") -> Optional[Tuple[float, float]]:
         """
         Estimate gaze from single eye.
 
@@ -103,39 +104,41 @@ class GazeEstimator:
             eye: Eye landmarks
 
         Returns:
-            (gaze_x, gaze_y) as numpy array, or None if invalid
+            (gaze_x, gaze_y), or None if invalid
 
         Method:
         - Iris position relative to eye corners gives horizontal gaze
         - Iris position relative to top/bottom gives vertical gaze
         - Normalized to [-1, +1] range
+
+        Works on Python floats: for a handful of scalars per eye, NumPy
+        scalar ops and np.clip cost more in dispatch than the arithmetic.
+        Landmarks come from FaceTracker with fixed shapes, so the only
+        invalid input is a degenerate eye, checked explicitly.
         """
-        try:
-            # Horizontal gaze: iris position between left and right corners
-            eye_width = eye.right_corner[0] - eye.left_corner[0]
-            if eye_width <= 0:
-                return None
+        left_x = float(eye.left_corner[0])
+        top_y = float(eye.top[1])
+        iris_x, iris_y = eye.iris_center.tolist()
 
-            iris_x_relative = eye.iris_center[0] - eye.left_corner[0]
-            gaze_x_normalized = (iris_x_relative / eye_width) * 2.0 - 1.0
+        # Horizontal gaze: iris position between left and right corners
+        eye_width = float(eye.right_corner[0]) - left_x
+        if eye_width <= 0:
+            return None
 
-            # Vertical gaze: iris position between top and bottom
-            eye_height = eye.bottom[1] - eye.top[1]
-            if eye_height <= 0:
-                return None
+        gaze_x = ((iris_x - left_x) / eye_width) * 2.0 - 1.0
 
-            iris_y_relative = eye.iris_center[1] - eye.top[1]
-            gaze_y_normalized = (iris_y_relative / eye_height) * 2.0 - 1.0
+        # Vertical gaze: iris position between top and bottom
+        eye_height = float(eye.bottom[1]) - top_y
+        if eye_height <= 0:
+            return None
 
-            # Clamp to valid range
-            gaze_x = np.clip(gaze_x_normalized, -1.0, 1.0)
-            gaze_y = np.clip(gaze_y_normalized, -1.0, 1.0)
+        gaze_y = ((iris_y - top_y) / eye_height) * 2.0 - 1.0
 
-            return np.array([gaze_x, gaze_y], dtype=np.float32)
+        # Clamp to valid range
+        gaze_x = -1.0 if gaze_x < -1.0 else (1.0 if gaze_x > 1.0 else gaze_x)
+        gaze_y = -1.0 if gaze_y < -1.0 else (1.0 if gaze_y > 1.0 else gaze_y)
 
-        except Exception as e:
-            logger.debug(f"Error in eye gaze estimation: {e}")
-            return None
+        return (gaze_x, gaze_y)
 
     @property
     def last_gaze(self) -> Optional[GazeVector]:
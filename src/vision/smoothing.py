@@ -5,7 +5,7 @@ Reduces cursor jitter through exponential moving average,
 dead zones, and velocity limiting.
 """
 
-import numpy as np
+import math
 from typing import Optional
 from dataclasses import dataclass
 
@@ -15,7 +15,7 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SmoothedGaze:
     """Smoothed gaze position in screen coordinates."""
 
@@ -47,14 +47,18 @@ class GazeSmoother:
         self._screen_width = screen_width
         self._screen_height = screen_height
 
+        # Clamp limits (screen bounds)
+        self._max_x = float(screen_width - 1)
+        self._max_y = float(screen_height - 1)
+
         # Current smoothed position (screen coords)
         self._smoothed_x: Optional[float] = None
         self._smoothed_y: Optional[float] = None
 
-        # Dead zone radius in pixels
-        self._dead_zone_pixels = int(
-            config.dead_zone_radius * min(screen_width, screen_height)
-        )
+        # Dead zone radius in pixels (and squared, for the per-frame check)
+        self._dead_zone_pixels = 0
+        self._dead_zone_sq = 0
+        self._set_dead_zone()
 
         logger.info(
             f"GazeSmoother initialized: "
@@ -92,16 +96,18 @@ class GazeSmoother:
         # Calculate displacement from current position
         dx = screen_x - self._smoothed_x
         dy = screen_y - self._smoothed_y
-        distance = np.sqrt(dx**2 + dy**2)
+        distance_sq = dx * dx + dy * dy
 
-        # Apply dead zone: ignore small movements
-        if distance < self._dead_zone_pixels:
+        # Apply dead zone: ignore small movements (squared compare, no sqrt)
+        if distance_sq < self._dead_zone_sq:
             return SmoothedGaze(
                 x=int(self._smoothed_x),
                 y=int(self._smoothed_y),
                 velocity=0.0,
             )
 
+        distance = math.sqrt(distance_sq)
+
         # Apply sensitivity
         dx *= self._config.sensitivity
         dy *= self._config.sensitivity
@@ -120,9 +126,12 @@ class GazeSmoother:
         new_x = self._smoothed_x + alpha * dx
         new_y = self._smoothed_y + alpha * dy
 
-        # Clamp to screen bounds
-        new_x = np.clip(new_x, 0, self._screen_width - 1)
-        new_y = np.clip(new_y, 0, self._screen_height - 1)
+        # Clamp to screen bounds (plain comparisons; np.clip on scalars
+        # costs microseconds in dispatch)
+        max_x = self._max_x
+        max_y = self._max_y
+        new_x = 0.0 if new_x < 0.0 else (max_x if new_x > max_x else new_x)
+        new_y = 0.0 if new_y < 0.0 else (max_y if new_y > max_y else new_y)
 
         # Update state
         self._smoothed_x = new_x
@@ -144,11 +153,11 @@ class GazeSmoother:
         """
         self._screen_width = width
         self._screen_height = height
+        self._max_x = float(width - 1)
+        self._max_y = float(height - 1)
 
         # Recalculate dead zone
-        self._dead_zone_pixels = int(
-            self._config.dead_zone_radius * min(width, height)
-        )
+        self._set_dead_zone()
 
         logger.info(f"Screen size updated: {width}x{height}")
 
@@ -162,12 +171,17 @@ class GazeSmoother:
         self._config = config
 
         # Recalculate dead zone
-        self._dead_zone_pixels = int(
-            config.dead_zone_radius * min(self._screen_width, self._screen_height)
-        )
+        self._set_dead_zone()
 
         logger.debug(f"Smoothing config updated: factor={config.smoothing_factor:.2f}")
 
+    def _set_dead_zone(self):
+        """Derive pixel dead zone from config and screen size."""
+        self._dead_zone_pixels = int(
+            self._config.dead_zone_radius * min(self._screen_width, self._screen_height)
+        )
+        self._dead_zone_sq = self._dead_zone_pixels * self._dead_zone_pixels
+
     def reset(self):
         """Reset smoother state (e.g., after calibration)."""
         self._smoothed_x = None
@@ -3,9 +3,21 @@ Tests for calibration schema and validation.
 """
 
 import pytest
+import numpy as np
 from datetime import datetime
 
-from src.storage.schema import CalibrationPoint, CalibrationData
+from src.storage.schema import SCHEMA_VERSION, CalibrationPoint, CalibrationData
+
+
+# Canonical 5-point set on a 1920x1080 screen. Points are frozen, so tests
+# share them and take slices or copies of the list as needed.
+_POINTS = (
+    CalibrationPoint(960, 540, 0.0, 0.0, 60),  # Center
+    CalibrationPoint(192, 540, -0.8, 0.0, 60),  # Left
+    CalibrationPoint(1728, 540, 0.8, 0.0, 60),  # Right
+    CalibrationPoint(960, 108, 0.0, -0.8, 60),  # Top
+    CalibrationPoint(960, 972, 0.0, 0.8, 60),  # Bottom
+)
 
 
 class TestCalibrationPoint:
@@ -82,19 +94,21 @@ class TestCalibrationPoint:
         assert point_restored.gaze_y == point.gaze_y
         assert point_restored.sample_count == point.sample_count
 
+    def test_immutable(self):
+        """Test that points are frozen and slotted."""
+        point = CalibrationPoint(100.0, 200.0, 0.5, -0.3, 60)
+
+        with pytest.raises(AttributeError):
+            point.gaze_x = 0.0
+        assert not hasattr(point, "__dict__")
+
 
 class TestCalibrationData:
     """Tests for CalibrationData."""
 
     def test_valid_calibration(self):
         """Test creating valid calibration data."""
-        points = [
-            CalibrationPoint(960, 540, 0.0, 0.0, 60),  # Center
-            CalibrationPoint(192, 540, -0.8, 0.0, 60),  # Left
-            CalibrationPoint(1728, 540, 0.8, 0.0, 60),  # Right
-            CalibrationPoint(960, 108, 0.0, -0.8, 60),  # Top
-            CalibrationPoint(960, 972, 0.0, 0.8, 60),  # Bottom
-        ]
+        points = list(_POINTS)
 
         calibration = CalibrationData(
             version="1.0",
@@ -107,10 +121,7 @@ class TestCalibrationData:
 
     def test_insufficient_points(self):
         """Test that too few points is invalid."""
-        points = [
-            CalibrationPoint(960, 540, 0.0, 0.0, 60),
-            CalibrationPoint(192, 540, -0.8, 0.0, 60),
-        ]
+        points = list(_POINTS[:2])
 
         calibration = CalibrationData(
             version="1.0",
@@ -124,11 +135,7 @@ class TestCalibrationData:
 
     def test_invalid_screen_dimensions(self):
         """Test that invalid screen dimensions are caught."""
-        points = [
-            CalibrationPoint(960, 540, 0.0, 0.0, 60),
-            CalibrationPoint(192, 540, -0.8, 0.0, 60),
-            CalibrationPoint(1728, 540, 0.8, 0.0, 60),
-        ]
+        points = list(_POINTS[:3])
 
         calibration = CalibrationData(
             version="1.0",
@@ -140,13 +147,37 @@ class TestCalibrationData:
         with pytest.raises(ValueError, match="Invalid screen dimensions"):
             calibration.validate()
 
+    def test_validation_rechecks_after_mutation(self):
+        """Test that a passed validation is reused only while the data is unchanged."""
+        calibration = CalibrationData(
+            screen_width=1920, screen_height=1080, points=list(_POINTS[:3])
+        )
+        assert calibration.validate() is True
+        assert calibration.validate() is True
+
+        # Changes after validation are re-checked
+        calibration.points[0] = CalibrationPoint(960, 540, 0.0, 0.0, 0)
+        with pytest.raises(ValueError, match="Invalid calibration point 0"):
+            calibration.validate()
+
+        calibration.points[0] = _POINTS[0]
+        assert calibration.validate() is True
+
+        calibration.screen_width = 0
+        with pytest.raises(ValueError, match="Invalid screen dimensions"):
+            calibration.validate()
+
+        calibration.screen_width = 1920
+        calibration.points.clear()
+        with pytest.raises(ValueError, match="Need at least 3"):
+            calibration.validate()
+
+        # Not part of equality or serialization
+        assert "_validated_key" not in calibration.to_dict()
+
     def test_screen_compatibility(self):
         """Test screen compatibility check."""
-        points = [
-            CalibrationPoint(960, 540, 0.0, 0.0, 60),
-            CalibrationPoint(192, 540, -0.8, 0.0, 60),
-            CalibrationPoint(1728, 540, 0.8, 0.0, 60),
-        ]
+        points = list(_POINTS[:3])
 
         calibration = CalibrationData(
             version="1.0",
@@ -171,19 +202,12 @@ class TestCalibrationData:
         # Should have a timestamp
         assert calibration.timestamp != ""
 
-        # Should be parseable as ISO format
-        timestamp = datetime.fromisoformat(calibration.timestamp)
-        assert timestamp is not None
+        # Should be parseable as ISO format (raises if not)
+        datetime.fromisoformat(calibration.timestamp)
 
     def test_serialization_roundtrip(self):
         """Test full serialization roundtrip."""
-        points = [
-            CalibrationPoint(960, 540, 0.0, 0.0, 60),
-            CalibrationPoint(192, 540, -0.8, 0.0, 60),
-            CalibrationPoint(1728, 540, 0.8, 0.0, 60),
-            CalibrationPoint(960, 108, 0.0, -0.8, 60),
-            CalibrationPoint(960, 972, 0.0, 0.8, 60),
-        ]
+        points = list(_POINTS)
 
         calibration = CalibrationData(
             version="1.0",
@@ -196,8 +220,8 @@ class TestCalibrationData:
         cal_dict = calibration.to_dict()
         cal_restored = CalibrationData.from_dict(cal_dict)
 
-        # Verify all fields match
-        assert cal_restored.version == calibration.version
+        # Verify all fields match (written in the current schema version)
+        assert cal_restored.version == SCHEMA_VERSION
         assert cal_restored.screen_width == calibration.screen_width
         assert cal_restored.screen_height == calibration.screen_height
         assert len(cal_restored.points) == len(calibration.points)
@@ -205,3 +229,58 @@ class TestCalibrationData:
         # Verify first point as example
         assert cal_restored.points[0].screen_x == points[0].screen_x
         assert cal_restored.points[0].gaze_x == points[0].gaze_x
+
+    def test_reads_v1_0_point_list(self):
+        """Test that the 1.0 list-of-points layout still loads."""
+        points = [
+            CalibrationPoint(960, 540, 0.0, 0.0, 60),
+            CalibrationPoint(192, 540, -0.8, 0.1, 45),
+            CalibrationPoint(1728, 540, 0.8, -0.1, 60),
+        ]
+        legacy = {
+            "version": "1.0",
+            "timestamp": "2024-01-01T12:00:00",
+            "screen_width": 1920,
+            "screen_height": 1080,
+            "points": [point.to_dict() for point in points],
+        }
+
+        calibration = CalibrationData.from_dict(legacy)
+
+        assert calibration.points == points
+        assert calibration.validate() is True
+
+        # Re-serialized in the column layout
+        cal_dict = calibration.to_dict()
+        assert cal_dict["version"] == SCHEMA_VERSION
+        assert "points" not in cal_dict
+        assert cal_dict["gaze_xy"][1] == [-0.8, 0.1]
+        assert cal_dict["sample_counts"] == [60, 45, 60]
+        assert CalibrationData.from_dict(cal_dict).points == points
+
+    def test_mismatched_columns_rejected(self):
+        """Test that point columns of different lengths do not load."""
+        cal_dict = CalibrationData(
+            screen_width=1920, screen_height=1080, points=list(_POINTS)
+        ).to_dict()
+        cal_dict["gaze_xy"] = cal_dict["gaze_xy"][:3]
+
+        with pytest.raises(ValueError, match="differ in length"):
+            CalibrationData.from_dict(cal_dict)
+
+    def test_point_arrays(self):
+        """Test gaze/screen arrays are (N, 2) float32 in point order."""
+        points = [
+            CalibrationPoint(960, 540, 0.0, 0.0, 60),
+            CalibrationPoint(192, 540, -0.8, 0.1, 60),
+            CalibrationPoint(1728, 540, 0.8, -0.1, 60),
+        ]
+        calibration = CalibrationData(screen_width=1920, screen_height=1080, points=points)
+
+        gaze = calibration.get_gaze_array()
+        screen = calibration.get_screen_array()
+
+        assert gaze.shape == (3, 2) and gaze.dtype == np.float32
+        assert screen.shape == (3, 2) and screen.dtype == np.float32
+        np.testing.assert_allclose(gaze[1], [-0.8, 0.1], rtol=1e-6)
+        np.testing.assert_allclose(screen[2], [1728, 540])
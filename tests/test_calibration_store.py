@@ -0,0 +1,87 @@
+"""
+Tests for calibration storage.
+"""
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.storage import calibration_store
+from src.storage.calibration_store import CalibrationStore, CalibrationStoreError
+from src.storage.schema import CalibrationData, CalibrationPoint
+
+
+def _make_calibration() -> CalibrationData:
+    """Build a small valid calibration."""
+    points = [
+        CalibrationPoint(screen_x=960.0, screen_y=540.0, gaze_x=0.0, gaze_y=0.0, sample_count=60),
+        CalibrationPoint(screen_x=192.0, screen_y=540.0, gaze_x=-0.5, gaze_y=0.0, sample_count=60),
+        CalibrationPoint(screen_x=1728.0, screen_y=540.0, gaze_x=0.5, gaze_y=0.0, sample_count=60),
+    ]
+    return CalibrationData(screen_width=1920, screen_height=1080, points=points)
+
+
+class TestCalibrationStore:
+    """Tests for CalibrationStore save/load."""
+
+    def test_save_load_roundtrip(self, tmp_path):
+        """Test that saved calibration loads back unchanged."""
+        store = CalibrationStore(StorageConfig(data_dir=tmp_path / "data"))
+        calibration = _make_calibration()
+
+        assert store.save(calibration) is True
+        assert store.exists()
+
+        loaded = store.load()
+
+        assert loaded.to_dict() == calibration.to_dict()
+
+    def test_non_atomic_write(self, tmp_path):
+        """Test saving in place without a temporary file."""
+        config = StorageConfig(data_dir=tmp_path / "data", atomic_write=False)
+        store = CalibrationStore(config)
+        calibration = _make_calibration()
+
+        store.save(calibration)
+
+        assert not config.calibration_path.with_suffix(".tmp").exists()
+        assert store.load().to_dict() == calibration.to_dict()
+
+    def test_stdlib_json_fallback(self, tmp_path, monkeypatch):
+        """Test the round trip without orjson installed."""
+        monkeypatch.setattr(calibration_store, "orjson", None)
+        store = CalibrationStore(StorageConfig(data_dir=tmp_path / "data"))
+        calibration = _make_calibration()
+
+        store.save(calibration)
+
+        assert store.load().to_dict() == calibration.to_dict()
+
+    def test_load_missing_returns_none(self, tmp_path):
+        """Test that loading with no file returns None."""
+        store = CalibrationStore(StorageConfig(data_dir=tmp_path / "data"))
+
+        assert store.load() is None
+
+    def test_load_corrupted_raises(self, tmp_path):
+        """Test that a corrupted file raises CalibrationStoreError."""
+        config = StorageConfig(data_dir=tmp_path / "data")
+        store = CalibrationStore(config)
+        config.calibration_path.write_bytes(b"{not json")
+
+        with pytest.raises(CalibrationStoreError, match="Corrupted"):
+            store.load()
+
+    def test_traversal_filename_rejected(self, tmp_path):
+        """Test that a calibration filename leaving the data directory is rejected."""
+        config = StorageConfig(data_dir=tmp_path / "data", calibration_filename="../escape.json")
+
+        with pytest.raises(CalibrationStoreError, match="Path traversal"):
+            CalibrationStore(config)
+
+    def test_symlinked_file_rejected(self, tmp_path):
+        """Test that a calibration file symlinked elsewhere is rejected."""
+        config = StorageConfig(data_dir=tmp_path / "data")
+        config.calibration_path.symlink_to(tmp_path / "elsewhere.json")
+
+        with pytest.raises(CalibrationStoreError, match="Path traversal"):
+            CalibrationStore(config)
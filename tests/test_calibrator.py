@@ -0,0 +1,114 @@
+"""
+Tests for calibration sample collection and averaging.
+"""
+
+import pytest
+import numpy as np
+
+from src.vision.gaze_estimator import GazeVector
+from src.core.config import CalibrationConfig
+from src.vision.calibrator import (
+    CalibrationState,
+    CalibrationTarget,
+    Calibrator,
+    trimmed_mean,
+)
+
+
+class TestTrimmedMean:
+    """Tests for trimmed_mean."""
+
+    def test_matches_sorted_reference(self):
+        """Test against a sort-based reference implementation."""
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=(90, 2)).astype(np.float32)
+
+        result = trimmed_mean(values, 0.15)
+
+        for col in range(2):
+            ordered = np.sort(values[:, col])
+            cut = int(0.15 * len(ordered))
+            expected = ordered[cut:len(ordered) - cut].mean(dtype=np.float64)
+            assert result[col] == pytest.approx(expected)
+
+    def test_rejects_outliers(self):
+        """Test that extreme values are trimmed away."""
+        values = np.zeros((20, 2), dtype=np.float32)
+        values[0] = (100.0, -100.0)
+
+        result = trimmed_mean(values, 0.1)
+
+        assert result[0] == pytest.approx(0.0)
+        assert result[1] == pytest.approx(0.0)
+
+
+class TestCalibrationTarget:
+    """Tests for CalibrationTarget sample buffer."""
+
+    def test_add_and_average(self):
+        """Test collecting samples and computing the average."""
+        target = CalibrationTarget(index=0, screen_x=960, screen_y=540, capacity=20)
+
+        for _ in range(20):
+            target.add_sample(GazeVector(x=0.25, y=-0.5, confidence=0.9))
+
+        assert target.sample_count == 20
+        assert target.samples.shape == (20, 2)
+
+        avg_x, avg_y = target.compute_average(0.1)
+        assert avg_x == pytest.approx(0.25)
+        assert avg_y == pytest.approx(-0.5)
+
+    def test_insufficient_samples(self):
+        """Test that too few samples yields no average."""
+        target = CalibrationTarget(index=0, screen_x=960, screen_y=540, capacity=20)
+        target.add_sample(GazeVector(x=0.0, y=0.0, confidence=0.9))
+
+        assert target.compute_average() is None
+
+    def test_buffer_full(self):
+        """Test that samples beyond capacity are rejected."""
+        target = CalibrationTarget(index=0, screen_x=960, screen_y=540, capacity=2)
+
+        assert target.add_sample(GazeVector(x=0.0, y=0.0, confidence=0.9))
+        assert target.add_sample(GazeVector(x=0.0, y=0.0, confidence=0.9))
+        assert not target.add_sample(GazeVector(x=0.0, y=0.0, confidence=0.9))
+        assert target.sample_count == 2
+
+
+class TestCalibrator:
+    """Tests for Calibrator target setup."""
+
+    def test_start_scales_targets(self):
+        """Test that targets are placed at normalized positions times screen size."""
+        config = CalibrationConfig()
+        calibrator = Calibrator(config, 1920, 1080)
+        calibrator.start()
+
+        positions = calibrator.target_positions
+        assert positions.shape == (len(config.target_positions), 2)
+
+        for i, (norm_x, norm_y) in enumerate(config.target_positions):
+            target = calibrator._targets[i]
+            assert target.screen_x == pytest.approx(norm_x * 1920)
+            assert target.screen_y == pytest.approx(norm_y * 1080)
+            assert tuple(positions[i]) == (target.screen_x, target.screen_y)
+
+    def test_collects_each_target_in_turn(self):
+        """Test that samples advance through targets and finalize the calibration."""
+        config = CalibrationConfig()
+        calibrator = Calibrator(config, 1920, 1080)
+        calibrator.start()
+
+        for i, (norm_x, norm_y) in enumerate(config.target_positions):
+            target = calibrator.get_current_target()
+            assert target.index == i
+
+            calibrator.set_state(CalibrationState.COLLECTING)
+            gaze = GazeVector(x=(norm_x - 0.5) * 2, y=(norm_y - 0.5) * 2, confidence=0.9)
+            for _ in range(config.samples_per_point):
+                assert calibrator.add_sample(gaze)
+
+        assert calibrator.get_current_target() is None
+        assert calibrator.state == CalibrationState.COMPLETED
+        assert len(calibrator.calibration_data.points) == len(config.target_positions)
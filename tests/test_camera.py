@@ -0,0 +1,51 @@
+"""
+Tests for camera frame conversion (no capture device needed).
+"""
+
+import pytest
+import numpy as np
+
+from src.core.config import CameraConfig
+from src.vision.camera import Camera
+
+
+def _bgr_frame(width, height):
+    """Solid BGR frame: blue=1, green=2, red=3."""
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[:] = (1, 2, 3)
+    return frame
+
+
+class TestCameraFrameConversion:
+    """Tests for Camera._to_camera_frame and the output-size shrink."""
+
+    @pytest.mark.parametrize(
+        "frame_size, expected",
+        [
+            ((640, 480), (320, 240)),  # Same aspect ratio
+            ((640, 200), (320, 100)),  # Only the width exceeds the bound
+            ((200, 480), (100, 240)),  # Only the height exceeds it
+            ((300, 200), (300, 200)),  # Already fits: not enlarged
+        ],
+    )
+    def test_shrink_keeps_aspect_ratio(self, frame_size, expected):
+        """Test that captures shrink to fit without stretching either axis."""
+        camera = Camera(CameraConfig(), output_size=(320, 240))
+
+        frame = camera._to_camera_frame(_bgr_frame(*frame_size))
+
+        assert frame.image.shape == (expected[1], expected[0], 3)
+        # Converted to RGB
+        assert tuple(frame.image[0, 0]) == (3, 2, 1)
+
+    def test_buffers_reused(self):
+        """Test that same-size frames reuse the shrink and RGB buffers."""
+        camera = Camera(CameraConfig(), output_size=(320, 240))
+
+        first = camera._to_camera_frame(_bgr_frame(640, 480))
+        small = camera._frame_small
+        second = camera._to_camera_frame(_bgr_frame(640, 480))
+
+        assert second.image is first.image
+        assert camera._frame_small is small
+        assert second.frame_number == 2
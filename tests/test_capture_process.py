@@ -0,0 +1,109 @@
+"""
+Tests for the shared-memory ring buffer reader of the capture process.
+
+The producer process is not started; tests attach the reader to an
+in-process ring and drive the sequence counter directly.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+import numpy as np
+
+from src.core.config import CameraConfig
+from src.vision import capture_process
+from src.vision.capture_process import CaptureProcess, _NUM_SLOTS
+
+_SHAPE = (4, 6, 3)
+
+
+def _publish(ring, seq):
+    """Write frame seq (filled with its own number) as the producer does."""
+    ring._slots[(seq - 1) % _NUM_SLOTS] = seq
+    ring._counter.value = seq
+    ring._frame_ready.set()
+
+
+@pytest.fixture
+def ring():
+    """CaptureProcess attached to an in-process ring buffer."""
+    capture = CaptureProcess(CameraConfig())
+    capture._slots = np.zeros((_NUM_SLOTS, *_SHAPE), dtype=np.uint8)
+    capture._frame = np.empty(_SHAPE, dtype=np.uint8)
+    capture._counter = SimpleNamespace(value=0)
+    capture._frame_ready = threading.Event()
+    capture._is_open = True
+    return capture
+
+
+class TestCaptureProcess:
+    """Tests for CaptureProcess.read_frame sequencing."""
+
+    def test_reads_latest_frame(self, ring):
+        """Test that each read returns the newest published slot."""
+        _publish(ring, 1)
+        frame = ring.read_frame()
+
+        assert frame.frame_number == 1
+        assert np.all(frame.image == 1)
+        assert ring.dropped_frames == 0
+
+        _publish(ring, 2)
+        assert np.all(ring.read_frame().image == 2)
+        assert ring.get_frame_size() == (_SHAPE[1], _SHAPE[0])
+
+    def test_counts_frames_overwritten_unseen(self, ring):
+        """Test that frames published between reads count as dropped."""
+        for seq in range(1, 4):
+            _publish(ring, seq)
+
+        frame = ring.read_frame()
+
+        assert np.all(frame.image == 3)
+        assert ring.frame_count == 1
+        assert ring.dropped_frames == 2
+
+    def test_times_out_without_new_frame(self, ring, monkeypatch):
+        """Test that a read with no new frame returns None after the timeout."""
+        monkeypatch.setattr(capture_process, "_READ_TIMEOUT", 0.01)
+        _publish(ring, 1)
+        ring.read_frame()
+
+        assert ring.read_frame() is None
+        assert ring.frame_count == 1
+
+    def test_retries_slot_lapped_during_copy(self, ring):
+        """Test that a copy the producer may have overwritten is redone."""
+        for seq in range(1, _NUM_SLOTS + 1):
+            _publish(ring, seq)
+
+        # The producer laps slot 0 (frame 1) while frame 1 is being copied
+        reads = iter([1, _NUM_SLOTS + 1, _NUM_SLOTS + 1])
+
+        class LappingCounter:
+            @property
+            def value(self):
+                return next(reads)
+
+        _publish(ring, _NUM_SLOTS + 1)
+        ring._counter = LappingCounter()
+
+        frame = ring.read_frame()
+
+        assert np.all(frame.image == _NUM_SLOTS + 1)
+        assert ring.dropped_frames == _NUM_SLOTS
+
+    def test_close_during_wait_returns_none(self, ring):
+        """Test that closing while a read waits makes it return None."""
+        results = []
+
+        reader = threading.Thread(target=lambda: results.append(ring.read_frame()))
+        reader.start()
+
+        ring.close()
+        ring._frame_ready.set()
+        reader.join(2.0)
+
+        assert results == [None]
+        assert not ring.is_open
@@ -0,0 +1,49 @@
+"""
+Tests for application configuration.
+"""
+
+import pytest
+
+from src.core.config import GazeConfig, StorageConfig
+
+
+class TestStorageConfig:
+    """Tests for StorageConfig path validation."""
+
+    def test_creates_data_directory(self, tmp_path):
+        """Test that the data directory is created and canonicalized."""
+        data_dir = tmp_path / "data"
+        config = StorageConfig(data_dir=data_dir)
+
+        assert data_dir.is_dir()
+        assert config.data_dir == data_dir.resolve()
+
+    def test_symlink_rejected(self, tmp_path):
+        """Test that a symlinked data directory is rejected."""
+        target = tmp_path / "target"
+        target.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(target, target_is_directory=True)
+
+        with pytest.raises(ValueError, match="must not be a symlink"):
+            StorageConfig(data_dir=link)
+
+    def test_parent_traversal_rejected(self, tmp_path):
+        """Test that '..' components are rejected."""
+        with pytest.raises(ValueError, match="Invalid data directory path"):
+            StorageConfig(data_dir=tmp_path / "a" / ".." / "b")
+
+
+class TestGazeConfig:
+    """Tests for GazeConfig validation."""
+
+    def test_inference_size_accepted(self):
+        """Test that a positive (width, height) pair is accepted."""
+        assert GazeConfig(inference_size=(320, 240)).inference_size == (320, 240)
+        assert GazeConfig().inference_size is None
+
+    @pytest.mark.parametrize("size", [(0, 240), (320, -1), (320.5, 240), (320,)])
+    def test_invalid_inference_size_rejected(self, size):
+        """Test that non-positive, non-integer or malformed sizes are rejected."""
+        with pytest.raises(ValueError, match="inference_size"):
+            GazeConfig(inference_size=size)
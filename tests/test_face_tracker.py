@@ -0,0 +1,101 @@
+"""
+Tests for face tracker frame preparation.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+import numpy as np
+
+from src.vision import face_tracker
+from src.vision.face_tracker import FaceTracker
+
+
+@pytest.fixture(scope="module")
+def tracker():
+    """Face tracker that downscales frames to fit 320x240."""
+    return FaceTracker(inference_size=(320, 240))
+
+
+class TestDownscale:
+    """Tests for FaceTracker._downscale."""
+
+    @pytest.mark.parametrize(
+        "frame_size, expected",
+        [
+            ((640, 480), (320, 240)),  # Same aspect ratio
+            ((640, 200), (320, 100)),  # Only the width exceeds the bound
+            ((200, 480), (100, 240)),  # Only the height exceeds it
+            ((1280, 720), (320, 180)),  # Wider aspect ratio
+        ],
+    )
+    def test_keeps_aspect_ratio(self, tracker, frame_size, expected):
+        """Test that frames shrink to fit without stretching either axis."""
+        width, height = frame_size
+        frame = np.zeros((height, width, 3), dtype=np.uint8)
+
+        small = tracker._downscale(frame)
+
+        assert small.shape == (expected[1], expected[0], 3)
+
+    def test_small_frame_unchanged(self, tracker):
+        """Test that a frame that already fits is not resized."""
+        frame = np.zeros((200, 300, 3), dtype=np.uint8)
+
+        assert tracker._downscale(frame) is frame
+
+    def test_reuses_buffer(self, tracker):
+        """Test that frames of the same size share one output buffer."""
+        frame = np.full((480, 640, 3), 7, dtype=np.uint8)
+
+        first = tracker._downscale(frame)
+        second = tracker._downscale(frame)
+
+        assert second is first
+        assert np.all(second == 7)
+
+
+class TestProcessFrame:
+    """Tests for the frame handed to Face Mesh by process_frame."""
+
+    @pytest.fixture
+    def errors(self, monkeypatch):
+        """Record errors process_frame swallows (logged at debug level)."""
+        logged = []
+        monkeypatch.setattr(face_tracker.logger, "debug", lambda *args: logged.append(args))
+        return logged
+
+    @pytest.fixture
+    def seen_flags(self, tracker, monkeypatch):
+        """Record the writeable flag of each frame passed to Face Mesh."""
+        seen = []
+
+        def process(frame):
+            seen.append(frame.flags.writeable)
+            return SimpleNamespace(multi_face_landmarks=None)
+
+        monkeypatch.setattr(tracker._face_mesh, "process", process)
+        return seen
+
+    def test_writeable_frame_restored(self, tracker, seen_flags, errors):
+        """Test that a writable frame is passed read-only and restored."""
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+
+        assert tracker.process_frame(frame) is None
+        assert seen_flags == [False]
+        assert errors == []
+        assert frame.flags.writeable
+
+    @pytest.mark.parametrize("by_nature", [True, False])
+    def test_read_only_frame_kept_read_only(self, tracker, seen_flags, errors, by_nature):
+        """Test that a read-only frame is processed and left read-only."""
+        if by_nature:
+            frame = np.frombuffer(bytes(240 * 320 * 3), dtype=np.uint8).reshape(240, 320, 3)
+        else:
+            frame = np.zeros((240, 320, 3), dtype=np.uint8)
+            frame.flags.writeable = False
+
+        assert tracker.process_frame(frame) is None
+        assert seen_flags == [False]
+        assert errors == []
+        assert not frame.flags.writeable
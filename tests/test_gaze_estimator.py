@@ -0,0 +1,49 @@
+"""
+Tests for gaze estimation from eye landmarks.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+import numpy as np
+
+from src.vision.gaze_estimator import GazeEstimator
+
+
+class TestGazeEstimator:
+    """Tests for per-eye gaze normalization."""
+
+    @staticmethod
+    def _eye(iris_x, iris_y):
+        """Eye spanning x in [0.3, 0.4] and y in [0.48, 0.52]."""
+        return SimpleNamespace(
+            left_corner=np.array([0.3, 0.5], dtype=np.float32),
+            right_corner=np.array([0.4, 0.5], dtype=np.float32),
+            top=np.array([0.35, 0.48], dtype=np.float32),
+            bottom=np.array([0.35, 0.52], dtype=np.float32),
+            iris_center=np.array([iris_x, iris_y], dtype=np.float32),
+        )
+
+    def test_normalizes_and_averages_eyes(self):
+        """Test iris position maps to [-1, 1] and both eyes are averaged."""
+        face = SimpleNamespace(
+            left_eye=self._eye(0.35, 0.50),  # Centered
+            right_eye=self._eye(0.40, 0.48),  # Right corner, top
+            confidence=0.9,
+        )
+
+        gaze = GazeEstimator().estimate(face)
+
+        assert gaze.x == pytest.approx(0.5, abs=1e-5)
+        assert gaze.y == pytest.approx(-0.5, abs=1e-5)
+        assert gaze.confidence == 0.9
+
+    def test_clamps_and_rejects_degenerate_eye(self):
+        """Test out-of-range iris is clamped and a zero-width eye is rejected."""
+        estimator = GazeEstimator()
+
+        assert estimator._estimate_eye_gaze(self._eye(0.9, 0.0)) == (1.0, -1.0)
+
+        flat = self._eye(0.35, 0.5)
+        flat.right_corner = flat.left_corner
+        assert estimator._estimate_eye_gaze(flat) is None
@@ -0,0 +1,72 @@
+"""
+Tests for gaze smoothing.
+"""
+
+import pytest
+
+from src.core.config import GazeConfig
+from src.vision.smoothing import GazeSmoother
+
+
+@pytest.fixture
+def smoother():
+    """Smoother on a 1000x1000 screen with a 10px dead zone."""
+    config = GazeConfig(
+        smoothing_factor=0.5,
+        dead_zone_radius=0.01,
+        max_velocity=100.0,
+        sensitivity=1.0,
+    )
+    return GazeSmoother(config, 1000, 1000)
+
+
+class TestGazeSmoother:
+    """Tests for GazeSmoother."""
+
+    def test_first_sample_passes_through(self, smoother):
+        """Test that the first sample initializes the position."""
+        result = smoother.smooth(300.0, 400.0)
+
+        assert (result.x, result.y) == (300, 400)
+        assert result.velocity == 0.0
+
+    def test_dead_zone(self, smoother):
+        """Test that movements inside the dead zone are ignored."""
+        smoother.smooth(500.0, 500.0)
+        result = smoother.smooth(506.0, 506.0)  # ~8.5px < 10px
+
+        assert (result.x, result.y) == (500, 500)
+        assert result.velocity == 0.0
+
+    def test_ema_step(self, smoother):
+        """Test that movement outside the dead zone is smoothed."""
+        smoother.smooth(500.0, 500.0)
+        result = smoother.smooth(540.0, 500.0)
+
+        assert (result.x, result.y) == (520, 500)
+        assert result.velocity == pytest.approx(40.0)
+
+    def test_velocity_limit(self, smoother):
+        """Test that large jumps are clamped to max velocity."""
+        smoother.smooth(100.0, 100.0)
+        result = smoother.smooth(900.0, 100.0)
+
+        assert result.velocity == pytest.approx(100.0)
+        assert result.x == 150  # 100 + 0.5 * 100
+
+    def test_screen_bounds(self, smoother):
+        """Test that output stays within the screen."""
+        smoother.smooth(995.0, 5.0)
+
+        for _ in range(10):
+            result = smoother.smooth(5000.0, -5000.0)
+
+        assert 0 <= result.x <= 999
+        assert 0 <= result.y <= 999
+
+    def test_reset(self, smoother):
+        """Test that reset clears the smoothed position."""
+        smoother.smooth(500.0, 500.0)
+        smoother.reset()
+
+        assert smoother.current_position is None
@@ -0,0 +1,184 @@
+"""
+Tests for the application state machine.
+"""
+
+import threading
+
+import pytest
+
+from src.core.state import (
+    AppState,
+    ErrorInfo,
+    StateMachine,
+    StateTransition,
+    _VALID_TRANSITIONS,
+    allowed_from,
+    is_valid_transition,
+)
+
+
+class TestTransitions:
+    """Tests for transition validation."""
+
+    @pytest.mark.parametrize(
+        "from_state,to_state",
+        [
+            (AppState.IDLE, AppState.CALIBRATING),
+            (AppState.IDLE, AppState.TRACKING),
+            (AppState.CALIBRATING, AppState.IDLE),
+            (AppState.TRACKING, AppState.PAUSED),
+            (AppState.PAUSED, AppState.TRACKING),
+            (AppState.TRACKING, AppState.IDLE),
+            (AppState.ERROR, AppState.IDLE),
+        ],
+    )
+    def test_valid(self, from_state, to_state):
+        """Test allowed transitions."""
+        assert is_valid_transition(from_state, to_state) is True
+
+    @pytest.mark.parametrize(
+        "from_state,to_state",
+        [
+            (AppState.CALIBRATING, AppState.TRACKING),
+            (AppState.IDLE, AppState.PAUSED),
+            (AppState.ERROR, AppState.TRACKING),
+            (AppState.PAUSED, AppState.CALIBRATING),
+        ],
+    )
+    def test_invalid(self, from_state, to_state):
+        """Test disallowed transitions."""
+        assert is_valid_transition(from_state, to_state) is False
+
+    def test_same_state(self):
+        """Test that staying in the same state is always valid."""
+        for state in AppState:
+            assert is_valid_transition(state, state) is True
+
+    def test_any_state_to_error(self):
+        """Test that every non-error state can enter ERROR."""
+        for state in AppState:
+            assert is_valid_transition(state, AppState.ERROR) is True
+
+    def test_matches_transition_table(self):
+        """Test the compiled mask agrees with _VALID_TRANSITIONS for every pair."""
+        for from_state in AppState:
+            for to_state in AppState:
+                expected = (
+                    from_state is to_state
+                    or to_state in _VALID_TRANSITIONS.get(from_state, frozenset())
+                )
+                assert is_valid_transition(from_state, to_state) is expected
+
+    def test_allowed_from(self):
+        """Test allowed targets agree with is_valid_transition."""
+        assert allowed_from(AppState.ERROR) == frozenset({AppState.IDLE})
+
+        for from_state in AppState:
+            for to_state in allowed_from(from_state):
+                assert is_valid_transition(from_state, to_state) is True
+
+    def test_state_transition_validated(self):
+        """Test that StateTransition.validated checks the transition."""
+        transition = StateTransition.validated(AppState.IDLE, AppState.TRACKING)
+        assert transition == (AppState.IDLE, AppState.TRACKING)
+
+        with pytest.raises(ValueError, match="Invalid state transition"):
+            StateTransition.validated(AppState.IDLE, AppState.PAUSED)
+
+
+class TestStateMachine:
+    """Tests for StateMachine."""
+
+    def test_transition(self):
+        """Test a valid transition updates current and previous state."""
+        machine = StateMachine()
+
+        assert machine.transition_to(AppState.TRACKING) is True
+        assert machine.current_state == AppState.TRACKING
+        assert machine.previous_state == AppState.IDLE
+
+    def test_invalid_transition_is_rejected(self):
+        """Test that an invalid transition leaves state unchanged."""
+        machine = StateMachine()
+
+        assert machine.transition_to(AppState.PAUSED) is False
+        assert machine.current_state == AppState.IDLE
+
+    def test_can_transition_to(self):
+        """Test the non-mutating transition check."""
+        machine = StateMachine()
+
+        assert machine.can_transition_to(AppState.CALIBRATING) is True
+        assert machine.can_transition_to(AppState.PAUSED) is False
+        assert machine.can_transition_to(AppState.IDLE) is True
+        assert machine.current_state == AppState.IDLE
+
+    def test_error_cleared_on_leave(self):
+        """Test that error info is cleared when leaving ERROR."""
+        machine = StateMachine()
+        machine.set_error(ErrorInfo(error_type="Test", message="boom"))
+
+        assert machine.current_state == AppState.ERROR
+        assert machine.error is not None
+
+        machine.transition_to(AppState.IDLE)
+
+        assert machine.error is None
+
+    def test_reset(self):
+        """Test reset returns to IDLE and clears error."""
+        machine = StateMachine(initial_state=AppState.TRACKING)
+        machine.set_error(ErrorInfo(error_type="Test", message="boom"))
+
+        machine.reset()
+
+        assert machine.current_state == AppState.IDLE
+        assert machine.previous_state == AppState.ERROR
+        assert machine.error is None
+
+    def test_listener_notified_on_change(self):
+        """Test that the listener sees each state change once."""
+        machine = StateMachine()
+        seen = []
+        machine.set_listener(seen.append)
+
+        machine.transition_to(AppState.TRACKING)
+        machine.transition_to(AppState.TRACKING)  # No-op, not reported
+        machine.transition_to(AppState.IDLE)
+        machine.transition_to(AppState.PAUSED)  # Invalid, not reported
+        machine.set_error(ErrorInfo(error_type="Test", message="boom"))
+        machine.reset()
+
+        assert seen == [AppState.TRACKING, AppState.IDLE, AppState.ERROR, AppState.IDLE]
+
+    def test_listener_order_matches_concurrent_changes(self):
+        """Test that interleaved changes are reported in the order applied."""
+        machine = StateMachine()
+        seen = []
+        first_notified = threading.Event()
+        second_done = threading.Event()
+
+        def listener(state):
+            if state == AppState.TRACKING:
+                # Give the second change every chance to overtake this one
+                first_notified.set()
+                second_done.wait(0.2)
+            seen.append(state)
+
+        machine.set_listener(listener)
+
+        first = threading.Thread(target=machine.transition_to, args=(AppState.TRACKING,))
+        first.start()
+        assert first_notified.wait(1.0)
+
+        def pause():
+            machine.transition_to(AppState.PAUSED)
+            second_done.set()
+
+        second = threading.Thread(target=pause)
+        second.start()
+        first.join()
+        second.join()
+
+        assert seen == [AppState.TRACKING, AppState.PAUSED]
+        assert seen[-1] == machine.current_state
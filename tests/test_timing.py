@@ -0,0 +1,98 @@
+"""
+Tests for timing utilities.
+"""
+
+import pytest
+
+from src.utils import timing
+from src.utils.timing import FPSCounter, FrameRateLimiter
+
+
+class FakeClock:
+    """Deterministic replacement for time.perf_counter."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Patch the timing module clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(timing.time, "perf_counter", fake)
+    monkeypatch.setattr(timing.time, "sleep", fake.sleep)
+    return fake
+
+
+class TestFPSCounter:
+    """Tests for FPSCounter."""
+
+    def test_no_frames(self):
+        """Test that FPS is zero before any frames."""
+        counter = FPSCounter()
+
+        assert counter.fps == 0.0
+
+    def test_steady_rate(self, clock):
+        """Test that a steady frame rate is reported exactly."""
+        counter = FPSCounter()
+
+        for _ in range(10):
+            counter.tick()
+            clock.now += 1.0 / 30.0
+
+        assert counter.fps == pytest.approx(30.0)
+
+    def test_ema_converges(self, clock):
+        """Test that FPS moves toward a new rate gradually."""
+        counter = FPSCounter(alpha=0.5)
+
+        counter.tick()
+        clock.now += 0.1
+        assert counter.tick() == pytest.approx(10.0)
+
+        clock.now += 0.05
+        assert counter.tick() == pytest.approx(15.0)
+
+    def test_reset(self, clock):
+        """Test that reset clears the measurement."""
+        counter = FPSCounter()
+        counter.tick()
+        clock.now += 0.1
+        counter.tick()
+
+        counter.reset()
+
+        assert counter.fps == 0.0
+
+
+class TestFrameRateLimiter:
+    """Tests for FrameRateLimiter."""
+
+    def test_deadlines_do_not_drift(self, clock):
+        """Test that frames land on a fixed grid despite work time."""
+        limiter = FrameRateLimiter(target_fps=10)
+        limiter.wait()
+
+        for frame in range(1, 6):
+            clock.now += 0.03  # Frame work
+            limiter.wait()
+            assert clock.now == pytest.approx(frame * 0.1)
+
+    def test_overrun_restarts_schedule(self, clock):
+        """Test that a slow frame does not cause catch-up bursts."""
+        limiter = FrameRateLimiter(target_fps=10)
+        limiter.wait()
+
+        clock.now += 0.35  # Overrun by several frames
+        limiter.wait()
+        assert clock.now == pytest.approx(0.35)
+
+        limiter.wait()
+        assert clock.now == pytest.approx(0.45)